@@ -0,0 +1,325 @@
+"""Benchmarks for fantasy_draft.py on synthetic player pools.
+
+Generates players.csv, the two rank lists, FantasyPros_adp.csv and projection
+files at several pool sizes, then times the loaders, ADP lookups, single picks
+and full drafts. Results are written as JSON so two commits can be compared:
+
+    python benchmark_draft.py --output before.json
+    python benchmark_draft.py --output after.json --compare before.json
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import fantasy_draft
+from fantasy_draft import FantasyBaseballDraft, auto_complete_draft
+
+BENCHMARK_VERSION = 1
+DEFAULT_SIZES = (500, 5000, 50000)
+
+FIRST_NAMES = ('Aaron', 'Adley', 'Andrés', 'Bobby', 'Bryce', 'Carlos', 'Corbin', 'Cristopher', 'Eloy', 'Eugenio',
+               'Félix', 'Freddie', 'Gerrit', 'Gunnar', 'Ha-Seong', 'Jazz', 'José', 'Josh', 'Julio', 'Kyle', 'Luis',
+               'Manny', 'Marcus', 'Mookie', 'Nolan', 'Ozzie', 'Pete', 'Rafael', 'Ronald', 'Salvador', 'Shohei',
+               'Spencer', 'Teoscar', 'Tyler', 'Vladimir', 'Wander', 'William', 'Xander', 'Yordan', 'Zack')
+LAST_NAMES = ('Acuña', 'Albies', 'Alvarez', 'Betts', 'Bichette', 'Burnes', 'Carroll', 'Castillo', 'Chisholm',
+              'Cole', 'Correa', 'Devers', 'Díaz', 'Franco', 'Freeman', 'Guerrero', 'Harper', 'Hernández', 'Judge',
+              'Kim', 'Lindor', 'Machado', 'Ohtani', 'Olson', 'Peña', 'Pérez', 'Ramírez', 'Riley', 'Rodríguez',
+              'Rutschman', 'Seager', 'Semien', 'Soto', 'Strider', 'Suárez', 'Tatis', 'Tucker', 'Turner', 'Witt',
+              'Yelich')
+TEAMS = ('ARI', 'ATL', 'BAL', 'BOS', 'CHC', 'CIN', 'CLE', 'COL', 'CWS', 'DET', 'HOU', 'KC', 'LAA', 'LAD', 'MIA',
+         'MIL', 'MIN', 'NYM', 'NYY', 'OAK', 'PHI', 'PIT', 'SD', 'SEA', 'SF', 'STL', 'TB', 'TEX', 'TOR', 'WSH')
+SUFFIXES = ('Jr.', 'II', 'III')
+BATTER_POSITIONS = ('C', '1B', '2B', '3B', 'SS', 'OF', 'OF', 'OF')
+
+ASCII_FOLD = str.maketrans('áéíóúñÁÉÍÓÚÑ', 'aeiounAEIOUN')
+
+
+def synthetic_names(size: int, rng: random.Random) -> List[str]:
+    """Return `size` distinct player names, some with a generational suffix."""
+    names = []
+    seen = set()
+    while len(names) < size:
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        if len(seen) >= len(FIRST_NAMES) * len(LAST_NAMES) // 2:
+            # Middle names or initials keep large pools unique
+            first, last = name.split(' ', 1)
+            middle = rng.choice(FIRST_NAMES) if rng.random() < 0.6 else f"{chr(ord('A') + rng.randrange(26))}."
+            name = f"{first} {middle} {last}"
+        if rng.random() < 0.05:
+            name += f" {rng.choice(SUFFIXES)}"
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def rank_variant(name: str, rng: random.Random) -> str:
+    """Spell a name the way another source might: no parentheses, no suffix dot, no accents."""
+    roll = rng.random()
+    if roll < 0.3:
+        name = name.replace(' (Batter)', '').replace(' (Pitcher)', '')
+    if roll < 0.15:
+        name = name.replace('Jr.', 'Jr')
+    if rng.random() < 0.1:
+        name = name.translate(ASCII_FOLD)
+    return name
+
+
+def generate_pool(directory: str, size: int, seed: int = 0) -> Dict[str, Any]:
+    """Write a synthetic set of draft input files for `size` players into `directory`.
+
+    Players get a latent skill that drives both their ADP and their projections,
+    so the rank lists, ADP and projected values broadly agree. A few two-way
+    players appear as separate (Batter) and (Pitcher) rows, as in the real file.
+    """
+    rng = random.Random(seed)
+    names = synthetic_names(size, rng)
+
+    players = []  # (name as listed, team, positions, skill)
+    for name in names:
+        team = rng.choice(TEAMS)
+        skill = rng.gauss(0.0, 1.0)
+        if rng.random() < 0.002:
+            players.append((f"{name} (Batter)", team, ('UTIL',), skill))
+            players.append((f"{name} (Pitcher)", team, ('SP',), skill))
+            continue
+        if rng.random() < 0.45:
+            positions = ('SP',) if rng.random() < 0.7 else ('RP',)
+        else:
+            positions = tuple(sorted(set(rng.choice(BATTER_POSITIONS) for _ in range(rng.choice((1, 1, 1, 2, 3))))))
+        players.append((name, team, positions, skill))
+    players = players[:size]
+
+    with open(os.path.join(directory, "players.csv"), "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for player_id, (name, team, positions, _) in enumerate(players, 1):
+            writer.writerow([player_id, f"{name} {team}", ','.join(positions)])
+
+    by_skill = sorted(players, key=lambda player: -player[3])
+    for filename, noise in (("my_rank.csv", 0.3), ("third_rank.csv", 0.6)):
+        ranked = sorted(players, key=lambda player: -(player[3] + rng.gauss(0.0, noise)))
+        with open(os.path.join(directory, filename), "w", newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for rank, (name, _, _, _) in enumerate(ranked, 1):
+                writer.writerow([rank, rank_variant(name, rng)])
+
+    with open(os.path.join(directory, "FantasyPros_adp.csv"), "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC)
+        writer.writerow(["RK", "PLAYER NAME", "TEAM", "POS", "BEST", "WORST", "AVG.", "STD.DEV", "ECR VS. ADP"])
+        for rank, (name, team, positions, _) in enumerate(by_skill[:int(size * 0.8)], 1):
+            stddev = 0.5 + rank * 0.05
+            writer.writerow([str(rank), rank_variant(name, rng), team, f"{positions[0]}{rank}",
+                             str(max(1, int(rank - 2 * stddev))), str(int(rank + 2 * stddev)),
+                             f"{rank + rng.uniform(-0.4, 0.4):.1f}", f"{stddev:.1f}", str(rng.randint(-20, 20))])
+
+    with open(os.path.join(directory, "projections_batters.csv"), "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["player_name", "team", "ab", "r", "hr", "rbi", "sb", "avg"])
+        for name, team, positions, skill in players:
+            if not fantasy_draft.is_pitcher(positions):
+                ab = rng.randint(350, 620)
+                writer.writerow([rank_variant(name, rng), team, ab, int(70 + 15 * skill), max(0, int(22 + 8 * skill)),
+                                 int(72 + 15 * skill), max(0, int(10 + 6 * rng.gauss(skill, 1.0))),
+                                 f"{0.255 + 0.015 * skill:.3f}"])
+
+    with open(os.path.join(directory, "projections_pitchers.csv"), "w", newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["player_name", "team", "ip", "w", "sv", "k", "era", "whip"])
+        for name, team, positions, skill in players:
+            if fantasy_draft.is_pitcher(positions):
+                closer = 'RP' in positions
+                writer.writerow([rank_variant(name, rng), team, 65 if closer else int(160 + 20 * skill),
+                                 max(0, int((4 if closer else 11) + 3 * skill)),
+                                 max(0, int(25 + 8 * skill)) if closer else 0,
+                                 int((75 if closer else 170) + 30 * skill), f"{3.9 - 0.4 * skill:.2f}",
+                                 f"{1.25 - 0.08 * skill:.2f}"])
+
+    return {'players': len(players), 'adp_rows': int(size * 0.8)}
+
+
+@contextlib.contextmanager
+def working_directory(path: str):
+    """Temporarily change the working directory (the loaders read relative paths)."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Run fn `repeat` times and return the fastest wall time in seconds and the last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def benchmark_pool(directory: str, repeat: int = 3) -> Dict[str, float]:
+    """Time the loaders, ADP lookups and drafts on the input files in `directory`."""
+    metrics = {}
+    with working_directory(directory):
+        loader = FantasyBaseballDraft(verbose=False)
+
+        elapsed, rows = best_time(lambda: loader.read_players("players.csv"), repeat)
+        metrics['load_players_ms'] = elapsed * 1000
+        metrics['load_players_rows_per_s'] = len(rows) / elapsed
+        elapsed, adp_data = best_time(lambda: loader.load_adp("FantasyPros_adp.csv"), repeat)
+        metrics['load_adp_ms'] = elapsed * 1000
+        metrics['load_adp_rows_per_s'] = len(adp_data) / elapsed
+        elapsed, _ = best_time(lambda: loader.load_rank_list("my_rank.csv"), repeat)
+        metrics['load_rank_list_ms'] = elapsed * 1000
+        elapsed, catalog = best_time(lambda: loader.load_catalog(use_cache=False), repeat)
+        metrics['load_catalog_ms'] = elapsed * 1000
+
+        # Rank-list spellings are not catalog names, so cold lookups go through
+        # the ADP name matcher; warm ones hit the cache
+        draft = FantasyBaseballDraft(catalog=catalog, verbose=False)
+        names = catalog['third_rank']
+        for label in ('cold', 'warm'):
+            if label == 'cold':
+                draft.state['adp_cache'] = {}
+            start = time.perf_counter()
+            for name in names:
+                draft.get_player_adp(name)
+            metrics[f'get_player_adp_{label}_us'] = (time.perf_counter() - start) / len(names) * 1e6
+
+        latencies = []
+        for _ in range(repeat):
+            draft = FantasyBaseballDraft(catalog=catalog, verbose=False)
+            while not draft.state['completed']:
+                start = time.perf_counter()
+                draft.draft_player()
+                latencies.append(time.perf_counter() - start)
+        for label, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99), ('max', 1.0)):
+            metrics[f'pick_{label}_us'] = percentile(latencies, fraction) * 1e6
+
+        # Availability odds over the whole pool, as refreshed after every pick
+        draft = FantasyBaseballDraft(catalog=catalog, verbose=False)
+        elapsed, _ = best_time(lambda: draft.availability_odds(count=20), repeat)
+        metrics['availability_odds_us'] = elapsed * 1e6
+
+        def full_draft():
+            with contextlib.redirect_stdout(io.StringIO()):
+                auto_complete_draft(FantasyBaseballDraft(catalog=catalog, verbose=False))
+        elapsed, _ = best_time(full_draft, repeat)
+        metrics['full_draft_ms'] = elapsed * 1000
+
+        # Memory is measured in its own pass since tracing slows everything down
+        tracemalloc.start()
+        try:
+            traced = FantasyBaseballDraft(verbose=False)
+            traced.use_catalog(traced.load_catalog(use_cache=False))
+            with contextlib.redirect_stdout(io.StringIO()):
+                auto_complete_draft(traced)
+            metrics['peak_memory_mb'] = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        finally:
+            tracemalloc.stop()
+    return metrics
+
+
+def current_commit() -> Optional[str]:
+    """Return the short hash of the checked-out commit, if this is a git checkout."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: Tuple[int, ...] = DEFAULT_SIZES, repeat: int = 3, seed: int = 0) -> Dict[str, Any]:
+    """Generate a pool per size and benchmark it; returns the JSON-ready results."""
+    results = {
+        'version': BENCHMARK_VERSION,
+        'commit': current_commit(),
+        'python': platform.python_version(),
+        'numpy': fantasy_draft.np is not None,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': repeat,
+        'seed': seed,
+        'sizes': {}
+    }
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix=f"draft_bench_{size}_") as directory:
+            pool = generate_pool(directory, size, seed)
+            print(f"Benchmarking {pool['players']} players...", flush=True)
+            results['sizes'][str(size)] = dict(pool, **benchmark_pool(directory, repeat))
+    return results
+
+
+def display_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None, threshold: float = 0.1):
+    """Print each metric per pool size, with the change from a baseline run if given.
+
+    Changes worse than `threshold` (as a fraction) are marked as regressions.
+    Throughput metrics (*_per_s) are better when higher; everything else when lower.
+    """
+    print(f"\nCommit: {results['commit'] or 'unknown'} | Python {results['python']} | "
+          f"numpy: {'yes' if results['numpy'] else 'no'}")
+    if baseline is not None:
+        print(f"Baseline: {baseline.get('commit') or 'unknown'} ({baseline.get('created', '')})")
+    for size, metrics in results['sizes'].items():
+        base_metrics = (baseline or {}).get('sizes', {}).get(size, {})
+        print(f"\nPool size {size}")
+        print("-" * 72)
+        for name, value in metrics.items():
+            row = f"{name:<28} {value:>14.2f}"
+            base = base_metrics.get(name)
+            if base:
+                change = value / base - 1
+                worse = -change if name.endswith('_per_s') else change
+                flag = "  REGRESSION" if worse > threshold else ""
+                row += f" {base:>14.2f} {change:>+8.1%}{flag}"
+            print(row)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help="player pool sizes to generate (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per measurement; the fastest counts")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the synthetic pools")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON results from an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="slowdown fraction reported as a regression (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)
+
+    results = run_benchmarks(tuple(args.sizes), args.repeat, args.seed)
+    display_results(results, baseline, args.threshold)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,482 @@
+"""Local draft-room server: many concurrent drafts in one asyncio process.
+
+Every room wraps a FantasyBaseballDraft built on one shared player catalog.
+Picks, rosters and ADP views are plain JSON over HTTP, and each room pushes
+its picks to WebSocket subscribers. Lookahead recommendations run in a
+process pool, which also runs the batches of simulated drafts, so the event
+loop only does the cheap per-pick work.
+
+    python draft_server.py --port 8765
+
+Endpoints (team numbers are 1-based):
+
+    GET    /rooms                         list rooms
+    POST   /rooms                         create a room {"my_team", "my_rank_teams", "third_rank_teams", "value_metric"}
+    GET    /rooms/<id>                    draft status
+    DELETE /rooms/<id>                    close a room
+    GET    /rooms/<id>/rosters            every team's roster
+    GET    /rooms/<id>/adp?count=20       top available players by ADP
+    GET    /rooms/<id>/adp/value          best value and reach picks at the current pick
+    GET    /rooms/<id>/adp/odds?count=20  chance players last to my next two picks
+    POST   /rooms/<id>/picks              {"player": name} for the team on the clock, or {"auto": n}
+    POST   /rooms/<id>/undo               take back the last pick
+    GET    /rooms/<id>/recommendations    lookahead picks for my team (?budget=seconds)
+    GET    /rooms/<id>/simulation         Monte Carlo availability (?drafts=n&seed=s, n up to 10000)
+    GET    /rooms/<id>/ws                 WebSocket stream of picks
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import logging
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from fantasy_draft import (MY_TEAM_ID, TEAMS_USING_THIRD_RANK, VALUE_METRICS, DraftInputError, FantasyBaseballDraft,
+                           build_team_strategies, load_league_config, run_simulation_batch, simulation_batches,
+                           summarize_simulations)
+
+logger = logging.getLogger("fantasy_draft.server")
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+SUBSCRIBER_QUEUE_SIZE = 256  # Pending events before a slow subscriber is dropped
+MAX_BODY_BYTES = 1 << 20
+MAX_SIMULATION_DRAFTS = 10000  # Per simulation request, so one room cannot monopolize the process pool
+HTTP_REASONS = {101: "Switching Protocols", 200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found",
+                405: "Method Not Allowed", 409: "Conflict", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    """An error answered with its status code and a JSON {"error": message} body."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# Per-process state for recommendation and simulation workers, set once by _init_room_worker
+_ROOM_WORKER = {}
+
+
+def _init_room_worker(catalog: Dict[str, Any]):
+    """Receive the parsed catalog once per worker process."""
+    _ROOM_WORKER['catalog'] = catalog
+
+
+def _recommend_in_worker(my_team_id: int, value_metric: str, team_strategies: Dict[int, str],
+                         history: List[Tuple[int, Optional[int]]], time_budget: float) -> Dict[str, Any]:
+    """Rebuild a room's draft from its (team ID, player ID) picks and run the lookahead search."""
+    catalog = _ROOM_WORKER['catalog']
+    draft = FantasyBaseballDraft(my_team_id=my_team_id, catalog=catalog, verbose=False,
+                                 value_metric=value_metric, team_strategies=team_strategies)
+    for team_id, player_id in history:
+        if player_id is not None:
+            draft.make_pick(team_id, draft.players[player_id])
+        draft.advance_pick()
+    results = draft.recommend_picks(time_budget)
+    results['candidates'] = [{'player': draft.players[player_id].name, 'value': value}
+                             for player_id, value in results['candidates']]
+    return results
+
+
+def _simulate_in_worker(my_team_id: int, team_strategies: Dict[int, str], seeds: List[int]) -> Dict[str, Any]:
+    """Run one batch of a room's simulated drafts on the worker's catalog."""
+    return run_simulation_batch(_ROOM_WORKER['catalog'], my_team_id, team_strategies, seeds)
+
+
+class DraftRoom:
+    """One hosted draft and the queues of its WebSocket subscribers."""
+
+    def __init__(self, room_id: str, draft: FantasyBaseballDraft):
+        self.room_id = room_id
+        self.draft = draft
+        self.subscribers: Set[asyncio.Queue] = set()
+
+    def status(self) -> Dict[str, Any]:
+        """Return where the draft stands."""
+        draft = self.draft
+        state = draft.state
+        return {
+            'room': self.room_id,
+            'my_team': draft.my_team_id + 1,
+            'value_metric': draft.value_metric,
+            'strategies': {team_id + 1: draft.team_strategy(team_id) for team_id in range(draft.league.num_teams)},
+            'round': state['round'] + 1,
+            'overall_pick': draft.overall_pick() + 1,
+            'on_clock': None if state['completed'] else draft.team_on_clock() + 1,
+            'completed': state['completed'],
+            'picks_made': len(state['history']),
+            'subscribers': len(self.subscribers)
+        }
+
+    def rosters(self) -> List[Dict[str, Any]]:
+        """Return each team's roster by slot, with player names."""
+        players = self.draft.players
+        return [{'team': team_id + 1,
+                 'roster': {slot: players[player_id].name if player_id is not None else None
+                            for slot, player_id in team.items()}}
+                for team_id, team in enumerate(self.draft.state['teams'])]
+
+    def pick_event(self, entry: Tuple[int, int, int, Optional[int], Optional[str]]) -> Dict[str, Any]:
+        """Describe a history entry as a pick event."""
+        round_idx, pick, team_id, player_id, slot = entry
+        return {
+            'type': 'pick',
+            'room': self.room_id,
+            'round': round_idx + 1,
+            'overall_pick': round_idx * self.draft.league.num_teams + pick + 1,
+            'team': team_id + 1,
+            'player': self.draft.players[player_id].name if player_id is not None else None,
+            'slot': slot
+        }
+
+    def pick(self, player_name: Optional[str] = None) -> Dict[str, Any]:
+        """Make the current pick: the named player, or the team's own strategy without a name."""
+        draft = self.draft
+        if draft.state['completed']:
+            raise HTTPError(409, "the draft is complete")
+        if player_name is None:
+            draft.draft_player()
+        else:
+            player_id = draft.player_ids.get(player_name)
+            if player_id is None:
+                raise HTTPError(404, f"unknown player {player_name!r}")
+            player = draft.players[player_id]
+            team_id = draft.team_on_clock()
+            if player_id not in draft.state['all_players']:
+                raise HTTPError(409, f"{player_name} has already been drafted")
+            if not draft.is_eligible(team_id, player):
+                raise HTTPError(409, f"Team {team_id + 1} has no open slot for {player_name}")
+            draft.make_pick(team_id, player)
+            draft.advance_pick()
+        event = self.pick_event(draft.state['history'][-1])
+        self.publish(event)
+        return event
+
+    def undo(self) -> Dict[str, Any]:
+        """Take back the most recent pick."""
+        history = self.draft.state['history']
+        if not history:
+            raise HTTPError(409, "there are no picks to undo")
+        event = dict(self.pick_event(history[-1]), type='undo')
+        self.draft.undo_pick()
+        self.publish(event)
+        return event
+
+    def publish(self, event: Dict[str, Any]):
+        """Queue an event for every subscriber, dropping subscribers that have fallen too far behind."""
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Replace the backlog with the end-of-stream marker
+                self.subscribers.discard(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+                logger.warning("Dropped a slow subscriber from room %s", self.room_id)
+
+
+class DraftServer:
+    """Hosts draft rooms over HTTP and WebSocket."""
+
+    def __init__(self, catalog: Dict[str, Any], workers: Optional[int] = None):
+        self.catalog = catalog
+        self.rooms: Dict[str, DraftRoom] = {}
+        self.room_ids = itertools.count(1)
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            initializer=_init_room_worker, initargs=(catalog,))
+
+    def create_room(self, options: Dict[str, Any]) -> DraftRoom:
+        """Open a room on the shared catalog."""
+        num_teams = self.catalog['league'].num_teams
+        try:
+            my_team_id = int(options.get('my_team', MY_TEAM_ID + 1)) - 1
+            teams_using_my_rank = [int(t) - 1 for t in options.get('my_rank_teams', [my_team_id + 1])]
+            teams_using_third_rank = [int(t) - 1 for t in options.get('third_rank_teams',
+                                                                       [t + 1 for t in TEAMS_USING_THIRD_RANK])]
+        except (TypeError, ValueError):
+            raise HTTPError(400, "team numbers must be integers")
+        if not all(0 <= t < num_teams for t in [my_team_id] + teams_using_my_rank + teams_using_third_rank):
+            raise HTTPError(400, f"team numbers must be between 1 and {num_teams}")
+        value_metric = options.get('value_metric', 'adp')
+        if value_metric not in VALUE_METRICS:
+            raise HTTPError(400, f"value_metric must be one of {', '.join(sorted(VALUE_METRICS))}")
+
+        room_id = str(next(self.room_ids))
+        draft = FantasyBaseballDraft(my_team_id=my_team_id, catalog=self.catalog, verbose=False,
+                                     value_metric=value_metric,
+                                     team_strategies=build_team_strategies(teams_using_my_rank,
+                                                                           teams_using_third_rank))
+        room = self.rooms[room_id] = DraftRoom(room_id, draft)
+        logger.info("Opened room %s", room_id)
+        return room
+
+    def room(self, room_id: str) -> DraftRoom:
+        room = self.rooms.get(room_id)
+        if room is None:
+            raise HTTPError(404, f"no room {room_id!r}")
+        return room
+
+    async def recommend(self, room: DraftRoom, time_budget: float) -> Dict[str, Any]:
+        """Run the lookahead search for a room in the process pool."""
+        draft = room.draft
+        history = [(team_id, player_id) for _, _, team_id, player_id, _ in draft.state['history']]
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, _recommend_in_worker, draft.my_team_id, draft.value_metric, draft.team_strategies,
+            history, time_budget)
+
+    async def simulate(self, room: DraftRoom, num_drafts: int, seed: Optional[int]) -> Dict[str, Any]:
+        """Run a Monte Carlo simulation for a room's settings as batches in the process pool.
+
+        Batches from every room queue on the same bounded pool, whose workers
+        already hold the catalog; only the seeds travel with each batch.
+        """
+        draft = room.draft
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        batch_results = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, _simulate_in_worker, draft.my_team_id, draft.team_strategies, seeds)
+            for seeds in simulation_batches(num_drafts, seed, self.workers)))
+        elapsed = time.perf_counter() - start
+        # Summing the counts walks the whole player pool, so it stays off the event loop
+        results = await loop.run_in_executor(
+            None, summarize_simulations, self.catalog, list(batch_results), num_drafts, seed, self.workers,
+            draft.my_team_id, elapsed)
+        return {key: value for key, value in results.items() if key != 'roster'}
+
+    async def route(self, method: str, path: str, query: Dict[str, str], body: Dict[str, Any]) -> Tuple[int, Any]:
+        """Dispatch an HTTP request. Returns (status, JSON-serializable body)."""
+        parts = [part for part in path.split('/') if part]
+        if parts == ['rooms']:
+            if method == 'GET':
+                return 200, [room.status() for room in self.rooms.values()]
+            if method == 'POST':
+                return 201, self.create_room(body).status()
+            raise HTTPError(405, "use GET or POST")
+        if len(parts) < 2 or parts[0] != 'rooms':
+            raise HTTPError(404, f"no route for {path}")
+
+        room = self.room(parts[1])
+        action = '/'.join(parts[2:])
+        if action == '' and method == 'GET':
+            return 200, room.status()
+        if action == '' and method == 'DELETE':
+            del self.rooms[room.room_id]
+            room.publish({'type': 'closed', 'room': room.room_id})
+            return 200, {'closed': room.room_id}
+        if action == 'rosters' and method == 'GET':
+            return 200, room.rosters()
+        if action == 'adp' and method == 'GET':
+            return 200, room.draft.top_available_by_adp(int(query.get('count', 20)))
+        if action == 'adp/value' and method == 'GET':
+            return 200, room.draft.adp_recommendations()
+        if action == 'adp/odds' and method == 'GET':
+            return 200, room.draft.availability_odds(count=int(query.get('count', 20)))
+        if action == 'picks' and method == 'POST':
+            if 'player' in body:
+                return 200, room.pick(str(body['player']))
+            picks = [room.pick() for _ in range(min(int(body.get('auto', 1)), room.draft.league.num_teams *
+                                                    room.draft.league.num_rounds))
+                     if not room.draft.state['completed']]
+            return 200, picks
+        if action == 'undo' and method == 'POST':
+            return 200, room.undo()
+        if action == 'recommendations' and method == 'GET':
+            return 200, await self.recommend(room, float(query.get('budget', 1.0)))
+        if action == 'simulation' and method == 'GET':
+            seed = query.get('seed')
+            num_drafts = int(query.get('drafts', 200))
+            if not 0 < num_drafts <= MAX_SIMULATION_DRAFTS:
+                raise HTTPError(400, f"drafts must be between 1 and {MAX_SIMULATION_DRAFTS}")
+            return 200, await self.simulate(room, num_drafts, int(seed) if seed is not None else None)
+        raise HTTPError(404 if method in ('GET', 'POST', 'DELETE') else 405, f"no route for {method} {path}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve one connection: a single HTTP request, or a WebSocket subscription."""
+        try:
+            request_line = (await reader.readline()).decode('latin-1').strip()
+            if not request_line:
+                return
+            method, target, _ = request_line.split(' ', 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1')
+                if line in ('\r\n', '\n', ''):
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            url = urlsplit(target)
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            parts = [part for part in url.path.split('/') if part]
+            if len(parts) == 3 and parts[0] == 'rooms' and parts[2] == 'ws':
+                await self.subscribe(self.room(parts[1]), headers, reader, writer)
+                return
+
+            length = int(headers.get('content-length') or 0)
+            if length > MAX_BODY_BYTES:
+                raise HTTPError(413, "request body too large")
+            body = {}
+            if length:
+                try:
+                    body = json.loads(await reader.readexactly(length))
+                except ValueError:
+                    raise HTTPError(400, "the request body must be JSON")
+                if not isinstance(body, dict):
+                    raise HTTPError(400, "the request body must be a JSON object")
+            status, payload = await self.route(method.upper(), url.path, query, body)
+        except HTTPError as e:
+            status, payload = e.status, {'error': str(e)}
+        except (ValueError, KeyError) as e:
+            status, payload = 400, {'error': f"bad request: {e}"}
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+            return
+        except Exception as e:
+            logger.exception("Error handling a request")
+            status, payload = 500, {'error': str(e)}
+
+        data = json.dumps(payload).encode('utf-8')
+        writer.write(f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+                     f"Connection: close\r\n\r\n".encode('latin-1') + data)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def subscribe(self, room: DraftRoom, headers: Dict[str, str], reader: asyncio.StreamReader,
+                        writer: asyncio.StreamWriter):
+        """Upgrade to a WebSocket and stream the room's events until either side closes."""
+        key = headers.get('sec-websocket-key')
+        if headers.get('upgrade', '').lower() != 'websocket' or not key:
+            raise HTTPError(400, "expected a WebSocket upgrade")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode('ascii')).digest()).decode('ascii')
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode('latin-1'))
+
+        queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+        room.subscribers.add(queue)
+        queue.put_nowait(dict(room.status(), type='status'))
+
+        async def send_events():
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                writer.write(websocket_frame(json.dumps(event).encode('utf-8')))
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    return
+                if event['type'] == 'closed':
+                    return
+
+        async def read_frames():
+            # Clients only send pings and the close handshake
+            while True:
+                try:
+                    opcode, payload = await read_websocket_frame(reader)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    return
+                if opcode == 0x8:
+                    return
+                if opcode == 0x9:
+                    writer.write(websocket_frame(payload, opcode=0xA))
+
+        tasks = [asyncio.ensure_future(send_events()), asyncio.ensure_future(read_frames())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            room.subscribers.discard(queue)
+            try:
+                writer.write(websocket_frame(b'', opcode=0x8))
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+def websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """Encode a single unmasked (server-to-client) WebSocket frame."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack('!BB', 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack('!BBQ', 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_websocket_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """Read one client WebSocket frame and return (opcode, unmasked payload)."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > MAX_BODY_BYTES:
+        raise ConnectionError("WebSocket frame too large")
+    mask = await reader.readexactly(4) if second & 0x80 else b'\0\0\0\0'
+    payload = bytes(byte ^ mask[i % 4] for i, byte in enumerate(await reader.readexactly(length)))
+    return first & 0x0F, payload
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765, workers: Optional[int] = None,
+                league_file: str = "league.json", use_cache: bool = True):
+    """Load the catalog once and serve draft rooms until cancelled."""
+    loader = FantasyBaseballDraft(verbose=False, league=load_league_config(league_file))
+    loader._check_required_files()
+    server = DraftServer(loader.load_catalog(use_cache=use_cache), workers)
+    listener = await asyncio.start_server(server.handle, host, port)
+    logger.info("Serving draft rooms on http://%s:%d", host, port)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Host many fantasy baseball draft rooms over HTTP and WebSocket.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on (default: %(default)s)")
+    parser.add_argument('--workers', type=int, help="processes for recommendations (default: CPU count)")
+    parser.add_argument('--league', default="league.json", help="league configuration file (default: %(default)s)")
+    parser.add_argument('--no-cache', action='store_true', help="parse the input files instead of using the cache")
+    parser.add_argument('--log-level', choices=('debug', 'info', 'warning', 'error'), default='warning',
+                        help="diagnostics written to stderr (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper(), stream=sys.stderr,
+                        format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.league, not args.no_cache))
+    except DraftInputError as e:
+        logger.error("%s", e)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,69 +1,1202 @@
+import argparse
+import bisect
 import csv
+import hashlib
+import io
+import itertools
 import json
+import logging
+import math
 import os
+import pickle
 import re
 import random
 import sys
-from typing import Dict, List, Optional, Tuple, Any, Union
-
-# Global configuration variables
+import time
+import unicodedata
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Any, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; projection valuation falls back to plain Python
+    np = None
+
+# Diagnostics from non-verbose drafts; silent unless the application configures logging
+logger = logging.getLogger("fantasy_draft")
+logger.addHandler(logging.NullHandler())
+
+# Default configuration; drafts take these as arguments
 MY_TEAM_ID = 1  # Change this to select which team is yours (0-7)
 
 # Define which teams use ranking lists
-# Teams not in either list will use the default best available player strategy
-TEAMS_USING_MY_RANK = [MY_TEAM_ID]  # Teams using my_rank.csv
-TEAMS_USING_THIRD_RANK = [5,6,7]     # Teams using third_rank.csv
+# Teams not in either list will use the default best available player strategy.
+# A team in both lists uses my_rank.csv.
+TEAMS_USING_MY_RANK = (MY_TEAM_ID,)  # Teams using my_rank.csv
+TEAMS_USING_THIRD_RANK = (5, 6, 7)   # Teams using third_rank.csv
+
+
+class DraftInputError(Exception):
+    """Raised when required input files are missing or hold no usable data."""
+
+
+def build_team_strategies(teams_using_my_rank, teams_using_third_rank) -> Dict[int, str]:
+    """Map team IDs to their ranking-list strategy. Teams left out take the best available player."""
+    strategies = {team_id: 'third_rank' for team_id in teams_using_third_rank}
+    strategies.update((team_id, 'my_rank') for team_id in teams_using_my_rank)
+    return strategies
+
+
+# Eligibility token for slot groups that any non-pitcher can fill
+BATTER = 'BATTER'
+PITCHER_POSITIONS = ('SP', 'P', 'RP')
+
+# Default roster as (slot group, number of slots, positions eligible for the group).
+# Players are assigned to the first group in this order with room, so catch-all
+# groups such as UTIL and P should come after the specific ones.
+DEFAULT_SLOT_GROUPS = (
+    ('C', 1, ('C',)),
+    ('1B', 1, ('1B',)),
+    ('2B', 1, ('2B',)),
+    ('SS', 1, ('SS',)),
+    ('3B', 1, ('3B',)),
+    ('OF', 3, ('OF',)),
+    ('UTIL', 2, (BATTER,)),
+    ('SP', 7, ('SP',)),
+    ('P', 5, PITCHER_POSITIONS),
+)
+
+DRAFT_ORDERS = ('snake', 'linear', 'third_round_reversal')
+
+# Projection files by player type, in order of preference
+PROJECTION_FILES = {
+    'batters': ('projections_batters.csv', 'sample_projections_batters.csv'),
+    'pitchers': ('projections_pitchers.csv', 'sample_projections_pitchers.csv'),
+}
+
+# Roto categories valued from projections as (stat, volume stat, direction).
+# Rate stats name the volume they are weighted by; direction -1 means lower is better.
+BATTING_CATEGORIES = (('r', None, 1), ('hr', None, 1), ('rbi', None, 1), ('sb', None, 1), ('avg', 'ab', 1))
+PITCHING_CATEGORIES = (('w', None, 1), ('sv', None, 1), ('k', None, 1), ('era', 'ip', -1), ('whip', 'ip', -1))
+
+
+def is_pitcher(positions: Tuple[str, ...]) -> bool:
+    """Return True if any of the positions is a pitching position."""
+    return any(pos in PITCHER_POSITIONS for pos in positions)
+
+
+class LeagueConfig:
+    """League geometry: number of teams and rounds, roster slot groups and draft order.
+
+    Everything derived from the geometry (slot names, group bitmasks and the
+    team on the clock for every overall pick) is computed once here.
+    """
+
+    def __init__(self, num_teams: int = 8, num_rounds: Optional[int] = None,
+                 slot_groups: Tuple[Tuple[str, int, Tuple[str, ...]], ...] = DEFAULT_SLOT_GROUPS,
+                 draft_order: str = 'snake'):
+        if draft_order not in DRAFT_ORDERS:
+            raise ValueError(f"Unknown draft order '{draft_order}'. Expected one of: {', '.join(DRAFT_ORDERS)}")
+        if num_teams < 1:
+            raise ValueError("A league needs at least one team.")
+        if num_rounds is not None and num_rounds < 1:
+            raise ValueError("A draft needs at least one round.")
+        for group, count, _ in slot_groups:
+            if count < 1:
+                raise ValueError(f"Slot group '{group}' needs at least one slot.")
+
+        self.num_teams = num_teams
+        self.slot_groups = tuple((group, count, tuple(positions)) for group, count, positions in slot_groups)
+        self.draft_order = draft_order
+
+        # Slot names: the group name for single slots, numbered otherwise (OF1, OF2, ...)
+        self.group_bits = {}
+        self.group_slots = {}
+        self.slot_group = {}
+        self.slot_names = []
+        for i, (group, count, _) in enumerate(self.slot_groups):
+            self.group_bits[group] = 1 << i
+            slots = [group] if count == 1 else [f'{group}{n}' for n in range(1, count + 1)]
+            self.group_slots[group] = slots
+            for slot in slots:
+                self.slot_group[slot] = group
+            self.slot_names.extend(slots)
+
+        # Groups whose open slots a group's players compete for: the group itself plus
+        # earlier groups all of whose players it also accepts (UTIL after the hitter
+        # groups, P after SP), since players are assigned to earlier groups first
+        self.group_feeds = {}
+        for i, (group, _, eligible) in enumerate(self.slot_groups):
+            self.group_feeds[group] = tuple(
+                earlier for earlier, _, earlier_eligible in self.slot_groups[:i + 1]
+                if all(pos in eligible or (BATTER in eligible and pos not in PITCHER_POSITIONS)
+                       for pos in earlier_eligible)
+            )
+        self.group_dependents = {group: tuple(other for other, feeds in self.group_feeds.items() if group in feeds)
+                                 for group in self.group_feeds}
+
+        self.num_rounds = num_rounds if num_rounds is not None else len(self.slot_names)
+        self.pick_order = [team_id for round_idx in range(self.num_rounds)
+                           for team_id in self.round_order(round_idx)]
+
+    def round_order(self, round_idx: int) -> List[int]:
+        """Return the team IDs in the order they pick in a round."""
+        forward = list(range(self.num_teams))
+        if self.draft_order == 'linear':
+            return forward
+        if self.draft_order == 'third_round_reversal' and round_idx >= 2:
+            # Round 3 repeats round 2's order, then the snake continues from there
+            reverse = round_idx % 2 == 0
+        else:
+            reverse = round_idx % 2 == 1
+        return forward[::-1] if reverse else forward
+
+    def slot_order(self, positions: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Return the slot groups a player with these positions can fill, in assignment order."""
+        pitcher = is_pitcher(positions)
+        order = []
+        for group, _, eligible in self.slot_groups:
+            if any(pos in eligible for pos in positions) or (BATTER in eligible and not pitcher):
+                order.append(group)
+        return tuple(order)
+
+    def slot_mask(self, groups: Tuple[str, ...]) -> int:
+        """Build the bitmask for a collection of slot groups."""
+        mask = 0
+        for group in groups:
+            mask |= self.group_bits[group]
+        return mask
+
+    def roster_spots(self, pitching: bool) -> int:
+        """Number of pitching (or non-pitching) roster spots across the league."""
+        spots = sum(count for _, count, eligible in self.slot_groups
+                    if all(pos in PITCHER_POSITIONS for pos in eligible) == pitching)
+        return spots * self.num_teams
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the configuration as JSON-serializable data."""
+        return {
+            'num_teams': self.num_teams,
+            'num_rounds': self.num_rounds,
+            'slot_groups': [[group, count, list(positions)] for group, count, positions in self.slot_groups],
+            'draft_order': self.draft_order
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'LeagueConfig':
+        """Build a configuration from data produced by to_dict (or a league JSON file)."""
+        slot_groups = data.get('slot_groups')
+        return cls(
+            num_teams=int(data.get('num_teams', 8)),
+            num_rounds=data.get('num_rounds'),
+            slot_groups=tuple((group, int(count), tuple(positions)) for group, count, positions in slot_groups)
+            if slot_groups else DEFAULT_SLOT_GROUPS,
+            draft_order=data.get('draft_order', 'snake')
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, LeagueConfig) and self.to_dict() == other.to_dict()
+
+    def __hash__(self) -> int:
+        return hash(json.dumps(self.to_dict(), sort_keys=True))
+
+
+def load_league_config(filename: str = "league.json") -> LeagueConfig:
+    """Load the league geometry from a JSON file, falling back to the default 8-team snake league."""
+    if not os.path.exists(filename):
+        return LeagueConfig()
+    try:
+        with open(filename, 'r') as f:
+            return LeagueConfig.from_dict(json.load(f))
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Error loading league configuration from {filename}: {e}. Using the default league.")
+        return LeagueConfig()
+
+
+NAME_SUFFIXES = frozenset(('jr', 'sr', 'ii', 'iii', 'iv'))
+NAME_MATCH_TIERS = ('full', 'base', 'initial', 'similar')  # Best first
+NAME_MATCH_THRESHOLD = 0.75  # Trigram similarity a name needs to match by spelling alone
+NAME_SUGGEST_THRESHOLD = 0.4  # Lowest similarity still offered as a suggestion in the name report
+TEAM_SUFFIX = re.compile(r'\s+(?!(?:II|III|IV)$)([A-Z]{2,3})$')
+NAME_QUALIFIER = re.compile(r'\(([^)]*)\)')
+NAME_DROPPED_PUNCTUATION = re.compile(r"[.']")
+NAME_SEPARATORS = re.compile(r'[^a-z0-9]+')
+
+
+def split_team(full_name: str) -> Tuple[str, str]:
+    """Split a trailing team abbreviation ("Aaron Judge NYY") off a listed name; suffixes like II are kept."""
+    match = TEAM_SUFFIX.search(full_name)
+    if match is None:
+        return full_name, ''
+    return full_name[:match.start()], match.group(1)
+
+
+def name_keys(name: str) -> Tuple[str, str, str]:
+    """Return the (full, base, initial) keys a name is matched by.
+
+    Accents are folded to ASCII and case and punctuation are dropped, so
+    "Julio Rodríguez" and "Julio Rodriguez" or "J.D." and "JD" agree. full
+    keeps a parenthesized qualifier such as "(Batter)" and any generational
+    suffix; base drops both; initial is base with the first name cut to its
+    initial.
+    """
+    if not name.isascii():
+        name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    folded = NAME_DROPPED_PUNCTUATION.sub('', name.lower())
+    qualifiers = []
+    if '(' in folded:
+        qualifiers = [' '.join(NAME_SEPARATORS.sub(' ', qualifier).split())
+                      for qualifier in NAME_QUALIFIER.findall(folded)]
+        folded = NAME_QUALIFIER.sub(' ', folded)
+    words = NAME_SEPARATORS.sub(' ', folded).split()
+    base_words = list(words)
+    while len(base_words) > 2 and base_words[-1] in NAME_SUFFIXES:
+        base_words.pop()
+    full = ' '.join(words + [f"({qualifier})" for qualifier in qualifiers if qualifier])
+    base = ' '.join(base_words)
+    initial = ' '.join([base_words[0][0]] + base_words[1:]) if len(base_words) > 1 else base
+    return full, base, initial
+
+
+def name_trigrams(key: str) -> set:
+    """Character trigrams of a name key, padded so word starts and ends count."""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def is_abbreviated(base: str) -> bool:
+    """Return True if a base key gives only an initial for the first name ("s ohtani")."""
+    first, _, rest = base.partition(' ')
+    return len(first) == 1 and bool(rest)
+
+
+class NameMatcher:
+    """Index of one source's names for reconciling names from other sources.
+
+    A name is looked up tier by tier and the first tier with an accepted
+    candidate wins: the full key, then the base key, then first initial plus
+    surname when either side gives only an initial, then trigram similarity
+    of the base keys. Matches are positions in the indexed name list, lowest
+    first. Every index is built up front and pickled with the matcher, so
+    one shared by many drafts is never written to by a lookup.
+    """
+    __slots__ = ('names', 'keys', 'full', 'base', 'initial', 'trigrams')
+
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        self.build_index()
+
+    def build_index(self):
+        """Index every name by its full, base and initial keys and by its base key's trigrams."""
+        self.keys = [name_keys(name) for name in self.names]
+        self.full, self.base, self.initial, self.trigrams = {}, {}, {}, {}
+        for position, (full, base, initial) in enumerate(self.keys):
+            self.full.setdefault(full, []).append(position)
+            self.base.setdefault(base, []).append(position)
+            self.initial.setdefault(initial, []).append(position)
+            for gram in name_trigrams(base):
+                self.trigrams.setdefault(gram, []).append(position)
+
+    def match(self, name: str, accept: Optional[Callable[[int], bool]] = None,
+              similar: bool = True) -> Tuple[Optional[str], List[int]]:
+        """Return the tier name matched in and the positions it matched, or (None, []).
+
+        accept filters candidate positions; a tier whose candidates are all
+        rejected falls through to the next. similar=False skips the trigram tier.
+        """
+        full, base, initial = name_keys(name)
+        for tier in ('full', 'base', 'initial'):
+            if tier == 'full':
+                candidates = self.full.get(full, ())
+            elif tier == 'base':
+                candidates = self.base.get(base, ())
+            else:
+                # Initials only stand in for a first name, never for a different one
+                abbreviated = is_abbreviated(base)
+                candidates = [position for position in self.initial.get(initial, ())
+                              if abbreviated or is_abbreviated(self.keys[position][1])]
+            if accept is not None:
+                candidates = [position for position in candidates if accept(position)]
+            if candidates:
+                return tier, list(candidates)
+        if similar:
+            score, candidates = self.similar(base, NAME_MATCH_THRESHOLD, accept)
+            if candidates and score >= NAME_MATCH_THRESHOLD:
+                return 'similar', candidates
+        return None, []
+
+    def similar(self, base: str, threshold: float,
+                accept: Optional[Callable[[int], bool]] = None) -> Tuple[float, List[int]]:
+        """Return the best trigram similarity (Jaccard) to a base key and the positions that reach it.
+
+        Only names that could reach threshold are scored: they must share
+        all but a few of the key's trigrams, so they appear in the posting
+        lists of its rarest ones.
+        """
+        grams = name_trigrams(base)
+        needed = max(1, math.ceil(threshold * len(grams)))
+        rarest = sorted(grams, key=lambda gram: len(self.trigrams.get(gram, ())))[:len(grams) - needed + 1]
+        candidates = set()
+        for gram in rarest:
+            candidates.update(self.trigrams.get(gram, ()))
+
+        best_score, best = 0.0, []
+        for position in sorted(candidates):
+            if accept is not None and not accept(position):
+                continue
+            other = name_trigrams(self.keys[position][1])
+            shared = len(grams & other)
+            score = shared / (len(grams) + len(other) - shared)
+            if score > best_score:
+                best_score, best = score, [position]
+            elif score == best_score:
+                best.append(position)
+        return best_score, best
+
+
+class Player:
+    """A catalog player, identified by a dense integer ID (its row in players.csv)."""
+    __slots__ = ('id', 'name', 'full_name', 'positions', 'slot_order', 'mask', 'adp', 'projection', 'zscore',
+                 'value')
+
+    def __init__(self, player_id: int, name: str, full_name: str, positions: Tuple[str, ...],
+                 slot_order: Tuple[str, ...] = (), mask: int = 0, adp: Optional[Dict[str, Any]] = None):
+        self.id = player_id
+        self.name = name
+        self.full_name = full_name
+        self.positions = positions
+        self.slot_order = slot_order
+        self.mask = mask
+        self.adp = adp
+        self.projection = None  # Projected stats, keyed by lower-case stat name
+        self.zscore = None  # Sum of category z-scores from the projections
+        self.value = None  # Projected value over replacement at the player's best slot group
+
+    def __repr__(self) -> str:
+        return f"Player({self.id}, {self.name!r}, {self.positions!r})"
+
+
+class AvailablePlayers:
+    """The players still available in one draft, as a view over the shared catalog.
+
+    Availability is one byte per catalog player ID, so a draft's pool costs
+    about a kilobyte per thousand players and the catalog itself is never
+    copied. Supports the dict operations drafts use, keyed by player ID.
+    Forks share the flags until one of them changes (copy-on-write).
+    """
+    __slots__ = ('players', 'flags', 'count', 'shared')
+
+    def __init__(self, players: List[Player], flags: Optional[bytearray] = None, count: Optional[int] = None):
+        self.players = players
+        self.flags = bytearray(b'\x01') * len(players) if flags is None else flags
+        self.count = count if count is not None else sum(self.flags)
+        self.shared = False
+
+    def fork(self) -> 'AvailablePlayers':
+        """Return an independent pool in O(1); both pools copy the flags on their next change."""
+        branch = AvailablePlayers(self.players, self.flags, self.count)
+        self.shared = branch.shared = True
+        return branch
+
+    def _unshare(self):
+        self.flags = bytearray(self.flags)
+        self.shared = False
+
+    def __contains__(self, player_id: Optional[int]) -> bool:
+        return player_id is not None and self.flags[player_id] == 1
+
+    def get(self, player_id: Optional[int], default: Optional[Player] = None) -> Optional[Player]:
+        """Return the player if still available, else default."""
+        if player_id is None or not self.flags[player_id]:
+            return default
+        return self.players[player_id]
+
+    def __getitem__(self, player_id: int) -> Player:
+        if not self.flags[player_id]:
+            raise KeyError(player_id)
+        return self.players[player_id]
+
+    def __setitem__(self, player_id: int, player: Player):
+        if not self.flags[player_id]:
+            if self.shared:
+                self._unshare()
+            self.flags[player_id] = 1
+            self.count += 1
+
+    def __delitem__(self, player_id: int):
+        if not self.flags[player_id]:
+            raise KeyError(player_id)
+        if self.shared:
+            self._unshare()
+        self.flags[player_id] = 0
+        self.count -= 1
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        return itertools.compress(range(len(self.flags)), self.flags)
+
+    def keys(self) -> Iterator[int]:
+        """Available player IDs in catalog order."""
+        return iter(self)
+
+    def values(self) -> Iterator[Player]:
+        """Available players in catalog order."""
+        return itertools.compress(self.players, self.flags)
+
+    def items(self) -> Iterator[Tuple[int, Player]]:
+        """(player ID, player) pairs in catalog order."""
+        return ((player.id, player) for player in self.values())
+
+
+class DraftCursor:
+    """Lazily advancing cursors over an ordered list of player candidates.
+
+    Each entry is a sequence of candidate player IDs; the entry stands for its
+    first candidate that is still available. One cursor per slot group points
+    at the earliest entry that could still fill that group, so a pick only
+    looks at entries past players that are already gone.
+    """
+    __slots__ = ('entries', 'group_bits', 'positions', 'entry_index')
+
+    def __init__(self, entries: List[Tuple[int, ...]], group_bits: Dict[str, int]):
+        self.entries = entries
+        self.group_bits = group_bits
+        self.positions = {group: 0 for group in group_bits}
+        self.entry_index = None
+
+    def copy(self) -> 'DraftCursor':
+        """Return an independent cursor over the same entries."""
+        cursor = DraftCursor.__new__(DraftCursor)
+        cursor.entries = self.entries
+        cursor.group_bits = self.group_bits
+        cursor.positions = self.positions.copy()
+        cursor.entry_index = self.entry_index
+        return cursor
+
+    def index_entries(self) -> Dict[int, int]:
+        """Return the first entry index of each player ID, building it on first use."""
+        if self.entry_index is None:
+            # Built lazily, since only undone drafts need it
+            self.entry_index = {}
+            for index, candidates in enumerate(self.entries):
+                for player_id in candidates:
+                    self.entry_index.setdefault(player_id, index)
+        return self.entry_index
+
+    def restore(self, player: Player):
+        """Rewind the cursors so a player returned to the pool can be picked again."""
+        index = self.index_entries().get(player.id)
+        if index is None:
+            return
+        for group, bit in self.group_bits.items():
+            if player.mask & bit and self.positions[group] > index:
+                self.positions[group] = index
+
+    def next_pick(self, available: AvailablePlayers, open_mask: int,
+                  profiler: Optional['DraftProfiler'] = None) -> Optional[Player]:
+        """Return the first entry's player that can fill one of the groups in open_mask."""
+        entries = self.entries
+        best_index = len(entries)
+        best_player = None
+        probes = 0
+
+        for group, bit in self.group_bits.items():
+            if not open_mask & bit:
+                continue
+
+            index = self.positions[group]
+            permanent = True
+            while index < best_index:
+                probes += 1
+                candidates = entries[index]
+                player = None
+                for player_id in candidates:
+                    player = available.get(player_id)
+                    if player is not None:
+                        break
+
+                if player is not None and player.mask & bit:
+                    best_index, best_player = index, player
+                    break
+
+                # Move the cursor past entries that can never fill this group again
+                if permanent and (player is None or not any(
+                        player_id in available and available[player_id].mask & bit
+                        for player_id in candidates)):
+                    self.positions[group] = index + 1
+                else:
+                    permanent = False
+                index += 1
+
+        if profiler is not None:
+            profiler.count('cursor_probes', probes)
+        return best_player
+
+
+def adp_value(player: Player) -> float:
+    """Value metric: ADP, with players lacking ADP data ranked last."""
+    return player.adp['adp'] if player.adp else float('inf')
+
+
+def adp_over_replacement(player: Player, replacement_adp: float) -> float:
+    """Picks by which a player's ADP beats replacement_adp (0 without ADP data)."""
+    if not player.adp:
+        return 0.0
+    return max(0.0, replacement_adp - player.adp['adp'])
+
+
+def csv_order_value(player: Player) -> float:
+    """Value metric: row order in players.csv."""
+    return player.id
+
+
+def projection_value(player: Player) -> float:
+    """Value metric: projected value over replacement, with unprojected players ranked last."""
+    return -player.value if player.value is not None else float('inf')
+
+
+# Metrics the best-available strategy can rank players by (lower is better)
+VALUE_METRICS: Dict[str, Callable[[Player], float]] = {
+    'adp': adp_value,
+    'csv': csv_order_value,
+    'projection': projection_value
+}
+
+
+def category_zscores(stats: Dict[str, List[float]], categories: Tuple[Tuple[str, Optional[str], int], ...],
+                     pool_size: int, passes: int = 2) -> List[float]:
+    """Sum of per-category z-scores for each player, measured against the draftable pool.
+
+    stats maps each stat name to one column of values per player. Rate stats
+    are converted to volume-weighted contributions, volume * (rate - pool rate),
+    so a .300 hitter over 600 AB counts for more than one over 200 AB. The pool
+    starts as every player and is narrowed to the top pool_size by the previous
+    pass's total. Uses numpy when it is installed.
+    """
+    num_players = len(next(iter(stats.values()), []))
+    if num_players == 0:
+        return []
+    pool_size = max(1, min(pool_size, num_players))
+
+    if np is not None:
+        columns = {name: np.asarray(column, dtype=float) for name, column in stats.items()}
+        pool = np.arange(num_players)
+        totals = np.zeros(num_players)
+        for _ in range(passes):
+            totals = np.zeros(num_players)
+            for stat, volume, direction in categories:
+                values = columns[stat]
+                if volume is not None:
+                    weights = columns[volume]
+                    pool_volume = weights[pool].sum()
+                    pool_rate = (weights[pool] * values[pool]).sum() / pool_volume if pool_volume else 0.0
+                    values = weights * (values - pool_rate)
+                std = values[pool].std()
+                if std > 0:
+                    totals += direction * (values - values[pool].mean()) / std
+            pool = np.argsort(-totals, kind='stable')[:pool_size]
+        return totals.tolist()
+
+    pool = list(range(num_players))
+    totals = [0.0] * num_players
+    for _ in range(passes):
+        totals = [0.0] * num_players
+        for stat, volume, direction in categories:
+            values = stats[stat]
+            if volume is not None:
+                weights = stats[volume]
+                pool_volume = sum(weights[i] for i in pool)
+                pool_rate = sum(weights[i] * values[i] for i in pool) / pool_volume if pool_volume else 0.0
+                values = [weight * (value - pool_rate) for weight, value in zip(weights, values)]
+            mean = sum(values[i] for i in pool) / len(pool)
+            std = (sum((values[i] - mean) ** 2 for i in pool) / len(pool)) ** 0.5
+            if std > 0:
+                totals = [total + direction * (value - mean) / std for total, value in zip(totals, values)]
+        pool = sorted(range(num_players), key=lambda i: -totals[i])[:pool_size]
+    return totals
+
+
+ADP_STDDEV_FLOOR = 0.5  # Picks; an ADP without a reported spread still gets some uncertainty
+# Chebyshev fit of erfc from Numerical Recipes; fractional error below 1.2e-7 everywhere
+ERFC_COEFFICIENTS = (-1.26551223, 1.00002368, 0.37409196, 0.09678418, -0.18628806,
+                     0.27886807, -1.13520398, 1.48851587, -0.82215223, 0.17087277)
+
+
+def normal_log_survival(x: Any) -> Any:
+    """log P(Z > x) for a standard normal Z, for a float or elementwise over a numpy array.
+
+    Stays in log space so that players far past their ADP keep finite odds.
+    """
+    vectorized = np is not None and isinstance(x, np.ndarray)
+    z = (np.abs(x) if vectorized else abs(x)) / math.sqrt(2)
+    t = 1.0 / (1.0 + 0.5 * z)
+    series = 0.0
+    for coefficient in reversed(ERFC_COEFFICIENTS):
+        series = series * t + coefficient
+    upper = (np.log(t) if vectorized else math.log(t)) - z * z + series - math.log(2)
+    if vectorized:
+        return np.where(x >= 0, upper, np.log1p(-np.exp(upper)))
+    return upper if x >= 0 else math.log1p(-math.exp(upper))
+
+
+def availability_probabilities(adp: Any, stddev: Any, current_pick: int, picks: Sequence[int]) -> List[Any]:
+    """Probability that each player is still available at each of the 1-based overall picks.
+
+    A player's draft position is modeled as normal around their ADP with
+    their ADP standard deviation, conditioned on them not having gone
+    before current_pick; a position that rounds to k means taken at pick k.
+    Takes and returns numpy arrays when numpy is installed, lists otherwise.
+    """
+    if np is not None:
+        now = normal_log_survival((current_pick - 0.5 - adp) / stddev)
+        return [np.exp(np.minimum(normal_log_survival((pick - 0.5 - adp) / stddev) - now, 0.0)) for pick in picks]
+
+    now = [normal_log_survival((current_pick - 0.5 - mean) / spread) for mean, spread in zip(adp, stddev)]
+    return [[math.exp(min(normal_log_survival((pick - 0.5 - mean) / spread) - survived, 0.0))
+             for mean, spread, survived in zip(adp, stddev, now)] for pick in picks]
+
+
+class ReplacementTracker:
+    """Replacement levels and values over replacement that follow the draft.
+
+    Reads the catalog's projected players of each slot group, sorted by
+    z-score total, and keeps only the sorted positions of the ones drafted
+    so far. A group's replacement level is the available player just past
+    its remaining demand, meaning its open slots league-wide plus those of
+    the earlier groups its players would fill first. A pick re-reads only
+    the levels of the groups the player was eligible for and of the groups
+    whose demand it changed.
+    """
+    __slots__ = ('arrays', 'taken', 'open_slots', 'league', 'players', 'replacement')
+
+    def __init__(self, arrays: Dict[str, List[Tuple[float, int]]], open_slots: Dict[str, int],
+                 league: 'LeagueConfig', players: List[Player], taken: Optional[Dict[str, List[int]]] = None):
+        self.arrays = arrays  # group -> sorted (-z-score total, player ID), shared and never modified
+        self.taken = taken if taken is not None else {group: [] for group in arrays}  # group -> sorted drafted indexes
+        self.open_slots = open_slots  # group -> open slots across all teams
+        self.league = league
+        self.players = players
+        self.replacement = {}
+        self.update(arrays)
+
+    def copy(self) -> 'ReplacementTracker':
+        """Return an independent tracker over the same shared arrays."""
+        tracker = ReplacementTracker.__new__(ReplacementTracker)
+        tracker.arrays = self.arrays
+        tracker.taken = {group: list(taken) for group, taken in self.taken.items()}
+        tracker.open_slots = dict(self.open_slots)
+        tracker.league = self.league
+        tracker.players = self.players
+        tracker.replacement = dict(self.replacement)
+        return tracker
+
+    def available_index(self, group: str, rank: int) -> Optional[int]:
+        """Index in the group's array of its rank-th available player (0-based), or None past the end."""
+        taken = self.taken[group]
+        index = rank
+        while True:
+            # The rank-th available index is rank plus the drafted indexes at or before it
+            shifted = rank + bisect.bisect_right(taken, index)
+            if shifted == index:
+                break
+            index = shifted
+        return index if index < len(self.arrays[group]) else None
+
+    def update(self, groups):
+        """Recompute the replacement level of the given groups."""
+        for group in groups:
+            demand = sum(self.open_slots[feed] for feed in self.league.group_feeds[group])
+            index = self.available_index(group, demand)
+            # Groups the projections are too shallow to fill are measured against the pool average
+            self.replacement[group] = -self.arrays[group][index][0] if index is not None else 0.0
+
+    def value(self, player: Player) -> Optional[float]:
+        """Value over replacement at the most favourable slot group the player can fill."""
+        if player.zscore is None:
+            return None
+        return player.zscore - min(self.replacement[group] for group in player.slot_order)
+
+    def pick(self, player: Player, group: Optional[str]):
+        """Account for a player drafted into a slot group (None if no slot was filled)."""
+        affected = set()
+        if player.zscore is not None:
+            entry = (-player.zscore, player.id)
+            for eligible_group in player.slot_order:
+                array = self.arrays[eligible_group]
+                index = bisect.bisect_left(array, entry)
+                if index < len(array) and array[index] == entry:
+                    taken = self.taken[eligible_group]
+                    position = bisect.bisect_left(taken, index)
+                    if position == len(taken) or taken[position] != index:
+                        taken.insert(position, index)
+            affected.update(player.slot_order)
+        if group is not None:
+            self.open_slots[group] -= 1
+            affected.update(self.league.group_dependents[group])
+        self.update(affected)
+
+    def unpick(self, player: Player, group: Optional[str]):
+        """Reverse pick() for an undone pick."""
+        affected = set()
+        if player.zscore is not None:
+            entry = (-player.zscore, player.id)
+            for eligible_group in player.slot_order:
+                index = bisect.bisect_left(self.arrays[eligible_group], entry)
+                taken = self.taken[eligible_group]
+                position = bisect.bisect_left(taken, index)
+                if position < len(taken) and taken[position] == index:
+                    del taken[position]
+            affected.update(player.slot_order)
+        if group is not None:
+            self.open_slots[group] += 1
+            affected.update(self.league.group_dependents[group])
+        self.update(affected)
+
+    def next_pick(self, open_mask: int) -> Optional[Player]:
+        """Return the projected player with the most value over replacement at a group in open_mask."""
+        best_entry = None
+        for group, bit in self.league.group_bits.items():
+            index = self.available_index(group, 0) if open_mask & bit else None
+            if index is not None:
+                negative_total, player_id = self.arrays[group][index]
+                entry = (negative_total + self.replacement[group], player_id)
+                if best_entry is None or entry < best_entry:
+                    best_entry = entry
+        return self.players[best_entry[1]] if best_entry is not None else None
+
+
+JOURNAL_VERSION = 1
+JOURNAL_COMPACT_PICKS = 64  # Compact on load once this many picks follow the last snapshot
+
+
+class PickJournal:
+    """Append-only JSON Lines log of a draft.
+
+    The file starts with a header record, then a snapshot of the draft when it
+    was last saved or compacted, then one small record per pick. Recording a
+    pick is a single appended line however far the draft has progressed.
+    """
+
+    def __init__(self, filename: str, fsync: bool = False):
+        self.filename = filename
+        self.fsync = fsync
+        self.drop_torn_record(filename)
+        self.file = open(filename, 'a', encoding='utf-8')
+
+    @staticmethod
+    def drop_torn_record(filename: str):
+        """Truncate a partially written final record so new records start on a fresh line."""
+        if not os.path.exists(filename):
+            return
+        with open(filename, 'rb+') as f:
+            end = f.seek(0, os.SEEK_END)
+            if end == 0:
+                return
+            f.seek(end - 1)
+            if f.read(1) == b'\n':
+                return
+            pos = end
+            while pos > 0:
+                step = min(4096, pos)
+                pos -= step
+                f.seek(pos)
+                newline = f.read(step).rfind(b'\n')
+                if newline >= 0:
+                    f.truncate(pos + newline + 1)
+                    return
+            f.truncate(0)
+
+    def append(self, record: Dict[str, Any]):
+        """Write one record and flush it to the OS (and to disk if fsync is on)."""
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+
+    def close(self):
+        """Close the journal file."""
+        self.file.close()
+
+    @classmethod
+    def create(cls, filename: str, records: List[Dict[str, Any]], fsync: bool = False) -> 'PickJournal':
+        """Atomically replace filename with the given records and open it for appending."""
+        temp_filename = filename + '.tmp'
+        with open(temp_filename, 'w', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        os.replace(temp_filename, filename)
+        return cls(filename, fsync)
+
+    @staticmethod
+    def read(filename: str) -> Optional[List[Dict[str, Any]]]:
+        """Read a journal's records, or return None if the file is not a pick journal.
+
+        A torn final line (from a crash mid-write) is ignored.
+        """
+        with open(filename, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        records = []
+        for line_num, line in enumerate(lines):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if line_num == len(lines) - 1 and records:
+                    break
+                if not records:
+                    return None
+                raise ValueError(f"corrupt journal record on line {line_num + 1}")
+            if not records and not (isinstance(record, dict) and record.get('type') == 'header'):
+                return None
+            records.append(record)
+        return records or None
+
+
+CACHE_FILE = ".draft_cache.pickle"
+CACHE_VERSION = 6  # Bump when parsing or catalog layout changes so old caches are ignored
+
+
+def file_digest(filename: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParsedInputCache:
+    """Pickled cache of parsed input files and the catalog joined from them.
+
+    Each source file is recorded with its size, mtime and SHA-256 digest. A
+    file whose size and mtime are unchanged is trusted as is; otherwise its
+    digest decides whether the cached parse still holds, so touching a file
+    does not force a re-parse. The whole cache is one pickle, read once.
+    """
+
+    def __init__(self, filename: str = CACHE_FILE):
+        self.filename = filename
+        self.files = {}  # source path -> {'size', 'mtime_ns', 'digest', 'parsed'}
+        self.catalog_entry = None  # (sources, league dict, built with numpy, catalog)
+        self.dirty = False
+        try:
+            with open(filename, 'rb') as f:
+                data = pickle.load(f)
+            if data.get('version') == CACHE_VERSION:
+                self.files = data['files']
+                self.catalog_entry = data['catalog']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Note: Ignoring unreadable cache {filename}: {e}")
+
+    def is_fresh(self, path: str) -> bool:
+        """Return True if the cached parse of path matches the file on disk."""
+        entry = self.files.get(path)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime_ns']:
+            return True
+        if stat.st_size != entry['size'] or file_digest(path) != entry['digest']:
+            return False
+        # Same contents with a new mtime; remember it so the next check is cheap
+        entry['mtime_ns'] = stat.st_mtime_ns
+        self.dirty = True
+        return True
+
+    def parsed(self, path: str, parse: Callable[[str], Any]) -> Any:
+        """Return the parsed contents of path, parsing it only if it changed."""
+        if self.is_fresh(path):
+            return self.files[path]['parsed']
+        stat = os.stat(path)
+        parsed = parse(path)
+        self.files[path] = {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': file_digest(path),
+            'parsed': parsed
+        }
+        self.dirty = True
+        return parsed
+
+    def catalog(self, sources: Dict[str, Optional[str]], league: 'LeagueConfig') -> Optional[Dict[str, Any]]:
+        """Return the cached catalog if it was built from these sources, unchanged, for this league.
+
+        A catalog built with numpy holds arrays where one built without it
+        holds lists, so it is only reused while numpy's availability matches.
+        """
+        if self.catalog_entry is None:
+            return None
+        cached_sources, league_data, with_numpy, catalog = self.catalog_entry
+        if cached_sources != sources or league_data != league.to_dict() or with_numpy != (np is not None):
+            return None
+        if not all(self.is_fresh(path) for path in sources.values() if path is not None):
+            return None
+        return catalog
 
-# Make sure a team isn't in both lists
-for team_id in TEAMS_USING_MY_RANK[:]:
-    if team_id in TEAMS_USING_THIRD_RANK:
-        TEAMS_USING_THIRD_RANK.remove(team_id)
-        print(f"Warning: Team {team_id+1} was in both ranking lists. Using my_rank for this team.")
+    def store_catalog(self, sources: Dict[str, Optional[str]], league: 'LeagueConfig', catalog: Dict[str, Any]):
+        """Record the catalog built from sources."""
+        self.catalog_entry = (dict(sources), league.to_dict(), np is not None, catalog)
+        self.dirty = True
+
+    def save(self):
+        """Write the cache if anything changed. Failing to write only costs the next startup time."""
+        if not self.dirty:
+            return
+        temp_filename = self.filename + '.tmp'
+        try:
+            with open(temp_filename, 'wb') as f:
+                pickle.dump({'version': CACHE_VERSION, 'files': self.files, 'catalog': self.catalog_entry},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_filename, self.filename)
+            self.dirty = False
+        except Exception as e:
+            logger.warning(f"Note: Could not write cache {self.filename}: {e}")
+
+
+class DraftProfiler:
+    """Counters and timers for the draft hot paths.
+
+    A draft only reports to a profiler it was given, and every hook is behind
+    an `is not None` check, so unprofiled drafts pay one attribute test per
+    hook. Timed spans are also kept as Chrome trace events (chrome://tracing
+    or Perfetto can open the file written by save(..., 'chrome')).
+    """
+
+    def __init__(self):
+        self.counters = {}
+        self.timers = {}  # name -> list of durations in seconds
+        self.events = []
+        self.origin = time.perf_counter()
+
+    def count(self, name: str, amount: int = 1):
+        """Add to a named counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record(self, name: str, start: float, category: str = 'draft', args: Optional[Dict[str, Any]] = None):
+        """Record a span that started at `start` (a perf_counter value) and ends now."""
+        end = time.perf_counter()
+        self.timers.setdefault(name, []).append(end - start)
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                 'ts': (start - self.origin) * 1e6, 'dur': (end - start) * 1e6}
+        if args:
+            event['args'] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, category: str = 'draft'):
+        """Time the body of a with statement as one span."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, category)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the counters and per-timer statistics (milliseconds)."""
+        timers = {}
+        for name, durations in self.timers.items():
+            ordered = sorted(durations)
+            timers[name] = {
+                'count': len(ordered),
+                'total_ms': sum(ordered) * 1000,
+                'mean_ms': sum(ordered) / len(ordered) * 1000,
+                'p50_ms': ordered[len(ordered) // 2] * 1000,
+                'p99_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+                'max_ms': ordered[-1] * 1000
+            }
+        return {'counters': dict(sorted(self.counters.items())), 'timers': timers}
+
+    def save(self, filename: str, trace_format: str = 'json'):
+        """Write the summary as JSON, or the spans and final counters as a Chrome trace."""
+        if trace_format == 'chrome':
+            end = (time.perf_counter() - self.origin) * 1e6
+            counters = [{'name': name, 'ph': 'C', 'pid': os.getpid(), 'tid': 0, 'ts': end, 'args': {'value': value}}
+                        for name, value in sorted(self.counters.items())]
+            data = {'traceEvents': self.events + counters, 'displayTimeUnit': 'ms'}
+        else:
+            data = self.summary()
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=1)
+
+    def display(self):
+        """Print the counters and timers."""
+        summary = self.summary()
+        print("\n" + "=" * 85)
+        print("DRAFT PROFILE")
+        print("=" * 85)
+        for name, value in summary['counters'].items():
+            print(f"{name:<32} {value:>12}")
+        print("-" * 85)
+        print(f"{'Timer':<32} | {'Count':>7} | {'Total ms':>10} | {'Mean ms':>8} | {'p99 ms':>8} | {'Max ms':>8}")
+        for name, stats in summary['timers'].items():
+            print(f"{name:<32} | {stats['count']:>7} | {stats['total_ms']:>10.2f} | {stats['mean_ms']:>8.3f} | "
+                  f"{stats['p99_ms']:>8.3f} | {stats['max_ms']:>8.3f}")
+        print("=" * 85 + "\n")
 
 
 class FantasyBaseballDraft:
-    def __init__(self, my_team_id: int = MY_TEAM_ID):
+    def __init__(self, my_team_id: int = MY_TEAM_ID, catalog: Optional[Dict[str, Any]] = None,
+                 verbose: bool = True, value_metric: str = 'adp', league: Optional[LeagueConfig] = None,
+                 team_strategies: Optional[Dict[int, str]] = None, profiler: Optional[DraftProfiler] = None):
         self.my_team_id = my_team_id
-        self.position_slots = [
-            'C', '1B', '2B', 'SS', '3B', 'OF1', 'OF2', 'OF3',
-            'UTIL1', 'UTIL2', 'SP1', 'SP2', 'SP3', 'SP4', 'SP5',
-            'SP6', 'SP7', 'P1', 'P2', 'P3', 'P4', 'P5'
-        ]
-        
-        # Check for file existence before initializing
-        self._check_required_files()
+        self.verbose = verbose
+        self.profiler = profiler
+        self.value_metric = value_metric
+        # Strategy per team ID ('my_rank', 'third_rank'; anything else takes best available)
+        if team_strategies is None:
+            team_strategies = build_team_strategies(TEAMS_USING_MY_RANK, TEAMS_USING_THIRD_RANK)
+        self.team_strategies = team_strategies
         
-        self.state = self.initialize_draft()
+        # Player eligibility is precomputed per league, so a catalog fixes the league
+        if catalog is not None:
+            if league is not None and league != catalog['league']:
+                raise ValueError("The catalog was built for a different league configuration.")
+            league = catalog['league']
+        self.league = league or LeagueConfig()
+        self.position_slots = list(self.league.slot_names)
+        self.slot_groups = self.league.group_slots
+        self.journal = None
         
-    def _check_required_files(self):
-        """Check that all required files exist before starting."""
-        missing_files = []
+        # Without a catalog the input files are read on first use (see __getattr__)
+        if catalog is not None:
+            self.use_catalog(catalog)
 
-        for filename in ["players.csv", "my_rank.csv", "third_rank.csv"]:
-            if not os.path.exists(filename):
-                missing_files.append(filename)
+    def __getattr__(self, name: str) -> Any:
+        """Load the catalog and the draft state the first time they are needed.
+
+        Python only calls this for attributes that are not set yet, so loaded
+        drafts pay nothing for the laziness.
+        """
+        if name in ('catalog', 'players', 'player_ids'):
+            self._check_required_files()
+            self.use_catalog(self.load_catalog())
+            return self.__dict__[name]
+        if name == 'state':
+            self.state = self.initialize_draft(self.catalog)
+            return self.state
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def log(self, level: int, message: str):
+        """Print a diagnostic in verbose drafts; otherwise hand it to the module logger."""
+        if self.verbose:
+            print(message)
+        else:
+            logger.log(level, message.strip())
 
+    def use_catalog(self, catalog: Dict[str, Any]):
+        """Attach a loaded catalog to this draft."""
+        self.catalog = catalog
+        self.players = catalog['players']
+        self.player_ids = catalog['player_ids']
+        
+    def _check_required_files(self):
+        """Check that all required files exist before loading them."""
+        missing_files = [filename for filename in ["players.csv", "my_rank.csv", "third_rank.csv"]
+                         if not os.path.exists(filename)]
         if missing_files:
-            print("ERROR: The following required files are missing:")
-            for filename in missing_files:
-                print(f"  - {filename}")
-            print("\nPlease ensure all required CSV files are in the current directory.")
-            sys.exit(1)
+            raise DraftInputError(f"The following required files are missing: {', '.join(missing_files)}")
 
         # Check for optional ADP file
         if not os.path.exists("FantasyPros_adp.csv"):
-            print("Note: FantasyPros_adp.csv not found. ADP data will not be available.")
+            self.log(logging.INFO, "Note: FantasyPros_adp.csv not found. ADP data will not be available.")
+
+    def load_catalog(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Load and pre-process all input files into a reusable player catalog.
 
-    def initialize_draft(self) -> Dict[str, Any]:
+        The catalog is treated as read-only by drafts built from it, so one
+        catalog can back any number of drafts (or be shipped to worker processes).
+        Parsed files and the finished catalog are kept in CACHE_FILE; an
+        unchanged set of inputs loads from it directly, and otherwise only the
+        files that changed are parsed again.
+        """
+        sources = self.input_sources()
+        cache = ParsedInputCache() if use_cache else None
+        if cache is not None:
+            catalog = cache.catalog(sources, self.league)
+            if catalog is not None:
+                return catalog
+
+        def parsed(source: str, parse: Callable[[str], Any], default: Any = None) -> Any:
+            path = sources[source]
+            if path is None:
+                return default
+            if self.profiler is None:
+                return cache.parsed(path, parse) if cache is not None else parse(path)
+            with self.profiler.span(f"parse:{source}", 'load'):
+                return cache.parsed(path, parse) if cache is not None else parse(path)
+
+        players = self.build_players(parsed('players', self.read_players))
+        my_rank = parsed('my_rank', self.load_rank_list)
+        third_rank = parsed('third_rank', self.load_rank_list)
+        adp_data = parsed('adp', self.load_adp, {})
+        projections = {kind: parsed(kind, self.load_projection_file, []) for kind in PROJECTION_FILES}
+
+        # Reconcile every source's names with players.csv once, so drafts never match names
+        name_matcher = NameMatcher([player.name for player in players])
+        name_matches = {source: {} for source in ('my_rank', 'third_rank', 'adp', *PROJECTION_FILES)}
+
+        catalog = {
+            'league': self.league,
+            'players': players,
+            'player_ids': {player.name: player.id for player in players},
+            'my_rank': my_rank,
+            'third_rank': third_rank,
+            'my_rank_ids': self.resolve_rank_list(my_rank, name_matcher, name_matches['my_rank']),
+            'third_rank_ids': self.resolve_rank_list(third_rank, name_matcher, name_matches['third_rank']),
+            'adp': adp_data,
+            'adp_matcher': NameMatcher(list(adp_data)),
+            'name_matcher': name_matcher,
+            'name_matches': name_matches  # source -> {name: (tier, player IDs, suggestion)}
+        }
+        self.join_adp(players, catalog, name_matches['adp'])
+        catalog['projections'] = projections
+        self.join_projections(players, projections, name_matcher, name_matches)
+        unmatched = sum(tier is None for table in name_matches.values() for tier, _, _ in table.values())
+        if unmatched:
+            self.log(logging.INFO, f"Note: {unmatched} names in the input files match no player "
+                                   f"(see --name-report for details).")
+        catalog['value_arrays'] = self.value_players(players)
+        catalog['value_queues'] = self.build_value_queues(players)
+        catalog['adp_order'] = sorted((player.adp['adp'], player.id) for player in players if player.adp)
+        catalog['adp_spread'] = self.build_adp_spread(players, catalog['adp_order'])
+
+        if cache is not None:
+            cache.store_catalog(sources, self.league, catalog)
+            cache.save()
+        return catalog
+
+    def input_sources(self) -> Dict[str, Optional[str]]:
+        """Return the input file for each catalog source, or None for missing optional files."""
+        sources = {
+            'players': "players.csv",
+            'my_rank': "my_rank.csv",
+            'third_rank': "third_rank.csv",
+            'adp': "FantasyPros_adp.csv" if os.path.exists("FantasyPros_adp.csv") else None
+        }
+        for kind, filenames in PROJECTION_FILES.items():
+            sources[kind] = next((name for name in filenames if os.path.exists(name)), None)
+        return sources
+
+    def initialize_draft(self, catalog: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Initialize the draft state with empty teams and loaded player data."""
-        players = self.load_players()
-        my_rank = self.load_my_rank()
-        third_rank = self.load_third_rank()
-        adp_data = self.load_adp()
+        if catalog is None:
+            catalog = self.load_catalog()
 
         # Create empty teams array with position slots
         teams = []
-        for i in range(8):
+        for i in range(self.league.num_teams):
             team = {}
             for pos in self.position_slots:
                 team[pos] = None
@@ -71,135 +1204,158 @@ class FantasyBaseballDraft:
 
         # Create empty draft grid
         draft_grid = []
-        for round_num in range(22):
+        for round_num in range(self.league.num_rounds):
             round_picks = []
-            for team in range(8):
+            for team in range(self.league.num_teams):
                 round_picks.append(None)
             draft_grid.append(round_picks)
 
-        return {
-            'all_players': players,
-            'my_rank': my_rank,
-            'third_rank': third_rank,
-            'adp': adp_data,
+        state = {
+            'all_players': AvailablePlayers(catalog['players']),
+            'my_rank': catalog['my_rank'],
+            'third_rank': catalog['third_rank'],
+            'my_rank_ids': catalog['my_rank_ids'],
+            'third_rank_ids': catalog['third_rank_ids'],
+            'adp': catalog['adp'],
+            'adp_matcher': catalog['adp_matcher'],
+            'adp_cache': {},  # Per draft, so the shared catalog is never written after load
+            'adp_order': catalog['adp_order'],
             'draft_grid': draft_grid,
             'teams': teams,
+            'open_slots': [self.count_open_slots(team) for team in teams],
+            'open_masks': [self.open_slot_mask(self.count_open_slots(team)) for team in teams],
+            'cursors': {
+                'my_rank': DraftCursor(catalog['my_rank_ids'], self.league.group_bits),
+                'third_rank': DraftCursor(catalog['third_rank_ids'], self.league.group_bits),
+                'best_available': self.best_available_cursor(catalog)
+            },
+            'history': [],  # (round, pick, team ID, player ID, slot) for every completed pick
+            'redo': [],
             'round': 0,
             'pick': 0,
             'completed': False
         }
+        state['valuation'] = self.replacement_tracker(state, catalog)
+        return state
 
-    def load_players(self) -> Dict[str, Dict[str, Any]]:
-        """Load player data from CSV file."""
-        data = {}
+    def build_value_queues(self, players: List[Player]) -> Dict[str, DraftCursor]:
+        """Rank the draftable players by every value metric, once per catalog.
+
+        Each ranking is a cursor with its entry index already built, so every
+        draft shares it read-only and only owns its cursor positions.
+        """
+        queues = {}
+        for metric, value_fn in VALUE_METRICS.items():
+            ranked = sorted((value_fn(player), player.id) for player in players if player.slot_order)
+            cursor = DraftCursor([(player_id,) for _, player_id in ranked], self.league.group_bits)
+            cursor.index_entries()  # Shared by the copies, so undo never rebuilds it per draft
+            queues[metric] = cursor
+        return queues
+
+    def build_adp_spread(self, players: List[Player], adp_order: List[Tuple[float, int]]) -> Tuple[Any, Any, Any]:
+        """Lay out the ADP players' IDs, ADPs and standard deviations in ADP order.
+
+        Numpy arrays when numpy is installed, lists otherwise; missing or tiny
+        spreads are raised to ADP_STDDEV_FLOOR.
+        """
+        player_ids = [player_id for _, player_id in adp_order]
+        adps = [adp for adp, _ in adp_order]
+        stddevs = [max(players[player_id].adp.get('stddev') or 0.0, ADP_STDDEV_FLOOR) for player_id in player_ids]
+        if np is not None:
+            return np.array(player_ids, dtype=np.intp), np.array(adps), np.array(stddevs)
+        return player_ids, adps, stddevs
+
+    def best_available_cursor(self, catalog: Dict[str, Any]) -> DraftCursor:
+        """Return a fresh best-available cursor ranked by this draft's value metric."""
+        return catalog['value_queues'][self.value_metric].copy()
+
+    def load_players(self) -> List[Player]:
+        """Load player data from CSV file into a table indexed by player ID."""
+        return self.build_players(self.read_players("players.csv"))
+
+    def read_players(self, filename: str) -> List[Tuple[str, str, Tuple[str, ...]]]:
+        """Parse the players file into (name, full name, positions) rows, one per player ID."""
+        rows = []
+        ids_by_name = {}
         try:
-            with open("players.csv", "r", newline='', encoding='utf-8-sig') as f:
+            with open(filename, "r", newline='', encoding='utf-8-sig') as f:
                 reader = csv.reader(f)
                 for row in reader:
                     try:
                         # Extract player name without team
                         full_name = row[1]
-                        name = re.sub(r'\s+[A-Z]{2,3}$', '', full_name)
+                        name, _ = split_team(full_name)
                         
                         # Handle positions
-                        positions = []
+                        positions = ()
                         if len(row) > 2 and row[2]:
                             positions_str = row[2].replace('"', '')
-                            positions = positions_str.split(',')
+                            positions = tuple(positions_str.split(','))
                         
-                        data[name] = {
-                            'name': name,
-                            'full_name': full_name,
-                            'positions': positions
-                        }
+                        # A repeated name replaces the earlier row but keeps its ID
+                        player_id = ids_by_name.setdefault(name, len(rows))
+                        if player_id == len(rows):
+                            rows.append((name, full_name, positions))
+                        else:
+                            rows[player_id] = (name, full_name, positions)
                     except (IndexError, ValueError) as e:
-                        print(f"Warning: Error processing player row {row}: {e}")
+                        self.log(logging.WARNING, f"Warning: Error processing player row {row}: {e}")
                         continue
         except FileNotFoundError:
-            print("ERROR: players.csv not found. This file is required.")
-            sys.exit(1)
+            raise DraftInputError(f"{filename} not found. This file is required.")
         
-        if not data:
-            print("ERROR: No valid player data found in players.csv.")
-            sys.exit(1)
+        if not rows:
+            raise DraftInputError(f"No valid player data found in {filename}.")
+        if self.profiler is not None:
+            self.profiler.count('rows_parsed', len(rows))
             
-        return data
+        return rows
+
+    def build_players(self, rows: List[Tuple[str, str, Tuple[str, ...]]]) -> List[Player]:
+        """Create the player table from parsed rows, with slot eligibility for this league."""
+        players = []
+        for player_id, (name, full_name, positions) in enumerate(rows):
+            slot_order = self.league.slot_order(positions)
+            players.append(Player(player_id, name, full_name, positions, slot_order, self.league.slot_mask(slot_order)))
+        return players
 
     def load_my_rank(self) -> List[str]:
         """Load player rankings from CSV file."""
-        ranks_by_name = {}
-        try:
-            with open("my_rank.csv", "r", newline='', encoding='utf-8-sig') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2:
-                        try:
-                            full_name = row[1]
-                            name = re.sub(r'\s+[A-Z]{2,3}$', '', full_name)
-                            # Clean up any potential BOM or whitespace from rank value
-                            rank_value = row[0].strip().lstrip('\ufeff')
-                            ranks_by_name[name] = int(rank_value)
-                        except (ValueError, IndexError) as e:
-                            print(f"Warning: Error processing row {row} in my_rank.csv: {e}")
-                            continue
-        except FileNotFoundError:
-            print("ERROR: my_rank.csv not found. This file is required.")
-            sys.exit(1)
-        
-        if not ranks_by_name:
-            print("ERROR: No valid ranking data found in my_rank.csv.")
-            sys.exit(1)
-            
-        # Sort by rank value
-        rank_pairs = []
-        for player_name, rank in ranks_by_name.items():
-            rank_pairs.append((player_name, rank))
-        
-        rank_pairs.sort(key=lambda x: x[1])
-        
-        # Extract just the player names in rank order
-        ordered_rank = [pair[0] for pair in rank_pairs]
-        
-        return ordered_rank
+        return self.load_rank_list("my_rank.csv")
 
     def load_third_rank(self) -> List[str]:
         """Load third-party player rankings from CSV file."""
+        return self.load_rank_list("third_rank.csv")
+
+    def load_rank_list(self, filename: str) -> List[str]:
+        """Load a ranking CSV (rank, player name) as player names in rank order."""
         ranks_by_name = {}
         try:
-            with open("third_rank.csv", "r", newline='', encoding='utf-8-sig') as f:
+            with open(filename, "r", newline='', encoding='utf-8-sig') as f:
                 reader = csv.reader(f)
                 for row in reader:
                     if len(row) >= 2:
                         try:
-                            full_name = row[1]
-                            name = re.sub(r'\s+[A-Z]{2,3}$', '', full_name)
+                            name, _ = split_team(row[1])
                             # Clean up any potential BOM or whitespace from rank value
                             rank_value = row[0].strip().lstrip('\ufeff')
                             ranks_by_name[name] = int(rank_value)
                         except (ValueError, IndexError) as e:
-                            print(f"Warning: Error processing row {row} in third_rank.csv: {e}")
+                            self.log(logging.WARNING, f"Warning: Error processing row {row} in {filename}: {e}")
                             continue
         except FileNotFoundError:
-            print("ERROR: third_rank.csv not found. This file is required.")
-            sys.exit(1)
+            raise DraftInputError(f"{filename} not found. This file is required.")
         
         if not ranks_by_name:
-            print("ERROR: No valid ranking data found in third_rank.csv.")
-            sys.exit(1)
+            raise DraftInputError(f"No valid ranking data found in {filename}.")
+        if self.profiler is not None:
+            self.profiler.count('rows_parsed', len(ranks_by_name))
             
-        # Sort by rank value
-        rank_pairs = []
-        for player_name, rank in ranks_by_name.items():
-            rank_pairs.append((player_name, rank))
-        
-        rank_pairs.sort(key=lambda x: x[1])
-        
-        # Extract just the player names in rank order
-        ordered_rank = [pair[0] for pair in rank_pairs]
-        
-        return ordered_rank
+        # Sort by rank value, then extract just the player names in rank order
+        rank_pairs = sorted(ranks_by_name.items(), key=lambda x: x[1])
+        return [pair[0] for pair in rank_pairs]
 
-    def load_adp(self) -> Dict[str, Dict[str, Any]]:
+    def load_adp(self, filename: str = "FantasyPros_adp.csv") -> Dict[str, Dict[str, Any]]:
         """Load ADP (Average Draft Position) data from FantasyPros_adp.csv.
 
         Expected CSV format:
@@ -209,12 +1365,12 @@ class FantasyBaseballDraft:
         """
         adp_data = {}
         try:
-            with open("FantasyPros_adp.csv", "r", newline='', encoding='utf-8-sig') as f:
+            with open(filename, "r", newline='', encoding='utf-8-sig') as f:
                 reader = csv.reader(f)
                 # Read header
                 header = next(reader, None)
                 if not header:
-                    print("Warning: FantasyPros_adp.csv is empty.")
+                    self.log(logging.WARNING, f"Warning: {filename} is empty.")
                     return adp_data
 
                 # Normalize header names
@@ -232,7 +1388,7 @@ class FantasyBaseballDraft:
                     stddev_idx = header.index('STDDEV')
                     ecr_idx = header.index('ECR VS ADP')
                 except ValueError as e:
-                    print(f"Warning: Missing expected column in ADP file: {e}")
+                    self.log(logging.WARNING, f"Warning: Missing expected column in ADP file: {e}")
                     return adp_data
 
                 for row in reader:
@@ -241,10 +1397,6 @@ class FantasyBaseballDraft:
 
                     try:
                         player_name = row[name_idx].strip().strip('"')
-                        # Clean player name for matching (remove Jr., etc.)
-                        clean_name = re.sub(r'\s+(Jr\.?|Sr\.?|II|III|IV)$', '', player_name)
-                        clean_name = re.sub(r'\s+[A-Z]{2,3}$', '', clean_name)  # Remove team abbrev if present
-
                         adp_value = float(row[avg_idx].strip().strip('"'))
                         rank = int(row[rk_idx].strip().strip('"'))
                         team = row[team_idx].strip().strip('"') if team_idx < len(row) else ''
@@ -254,7 +1406,8 @@ class FantasyBaseballDraft:
                         stddev = float(row[stddev_idx].strip().strip('"')) if stddev_idx < len(row) else None
                         ecr_vs_adp = row[ecr_idx].strip().strip('"') if ecr_idx < len(row) else ''
 
-                        adp_data[clean_name] = {
+                        # Names are reconciled with players.csv when the catalog is built
+                        adp_data[player_name] = {
                             'adp': adp_value,
                             'rank': rank,
                             'team': team,
@@ -266,10 +1419,6 @@ class FantasyBaseballDraft:
                             'original_name': player_name
                         }
 
-                        # Also store with original name as key for exact matches
-                        if player_name != clean_name:
-                            adp_data[player_name] = adp_data[clean_name]
-
                     except (ValueError, IndexError) as e:
                         continue  # Skip malformed rows silently
 
@@ -277,37 +1426,201 @@ class FantasyBaseballDraft:
             # ADP file is optional, return empty dict
             return adp_data
         except Exception as e:
-            print(f"Warning: Error loading ADP data: {e}")
+            self.log(logging.WARNING, f"Warning: Error loading ADP data: {e}")
             return adp_data
 
-        print(f"Loaded ADP data for {len(adp_data)} players.")
+        self.log(logging.INFO, f"Loaded ADP data for {len(adp_data)} players.")
         return adp_data
 
-    def get_player_adp(self, player_name: str) -> Optional[Dict[str, Any]]:
-        """Get ADP data for a player by name with fuzzy matching."""
-        if not self.state.get('adp'):
+    def load_projection_file(self, filename: str) -> List[Dict[str, Any]]:
+        """Load one projections CSV.
+
+        Expected CSV format: a player_name column, an optional team column and
+        numeric stat columns (e.g. ab, r, hr, rbi, sb, avg / ip, w, sv, k, era, whip).
+        """
+        rows = []
+        try:
+            with open(filename, "r", newline='', encoding='utf-8-sig') as f:
+                for row in csv.DictReader(f):
+                    player_name = (row.get('player_name') or '').strip()
+                    if not player_name:
+                        continue
+                    stats = {}
+                    for column, value in row.items():
+                        try:
+                            stats[column.strip().lower()] = float(value)
+                        except (AttributeError, TypeError, ValueError):
+                            continue  # Names, teams and blank cells
+                    rows.append({
+                        'name': player_name,
+                        'team': (row.get('team') or '').strip(),
+                        'stats': stats
+                    })
+        except Exception as e:
+            self.log(logging.WARNING, f"Warning: Error loading projections from {filename}: {e}")
+            return rows
+        self.log(logging.INFO, f"Loaded projections for {len(rows)} players from {filename}.")
+        return rows
+
+    def join_projections(self, players: List[Player], projections: Dict[str, List[Dict[str, Any]]],
+                         name_matcher: NameMatcher, name_matches: Dict[str, Dict[str, Tuple]]):
+        """Attach projected stats to players, reconciling names like the rank lists do.
+
+        Batter projections only match non-pitchers and pitcher projections
+        only pitchers, so "Shohei Ohtani" reaches both Ohtani rows. The first
+        row for a player wins.
+        """
+        for kind, rows in projections.items():
+            pitching = kind == 'pitchers'
+
+            def accept(player_id: int) -> bool:
+                return is_pitcher(players[player_id].positions) == pitching
+
+            for row in rows:
+                tier, candidates = name_matcher.match(row['name'], accept)
+                self.record_name_match(name_matches[kind], row['name'], tier, candidates[:1], name_matcher)
+                if candidates and players[candidates[0]].projection is None:
+                    players[candidates[0]].projection = row['stats']
+
+    def value_players(self, players: List[Player]) -> Dict[str, List[Tuple[float, int]]]:
+        """Set each projected player's z-score total and pre-draft value over replacement.
+
+        Hitters and pitchers get category z-score totals against their own
+        draftable pools (league roster spots). Replacement levels come from a
+        ReplacementTracker with every slot open. Returns the per-group arrays
+        of (-z-score total, player ID) that drafts track replacement with.
+        """
+        totals = {}
+        for categories, pitching in ((BATTING_CATEGORIES, False), (PITCHING_CATEGORIES, True)):
+            group = [player for player in players
+                     if player.projection is not None and player.slot_order and is_pitcher(player.positions) == pitching]
+            if not group:
+                continue
+            stat_names = {stat for stat, _, _ in categories} | {volume for _, volume, _ in categories if volume}
+            stats = {name: [player.projection.get(name, 0.0) for player in group] for name in stat_names}
+            for player, total in zip(group, category_zscores(stats, categories, self.league.roster_spots(pitching))):
+                totals[player.id] = total
+
+        arrays = {group: [] for group in self.league.group_bits}
+        for player_id, total in totals.items():
+            player = players[player_id]
+            player.zscore = total
+            for group in player.slot_order:
+                arrays[group].append((-total, player_id))
+        for array in arrays.values():
+            array.sort()
+
+        # Values at the start of the draft, with every roster slot open
+        open_slots = {group: count * self.league.num_teams for group, count, _ in self.league.slot_groups}
+        tracker = ReplacementTracker(arrays, open_slots, self.league, players)
+        for player_id in totals:
+            players[player_id].value = tracker.value(players[player_id])
+        return arrays
+
+    def replacement_tracker(self, state: Dict[str, Any], catalog: Dict[str, Any]) -> Optional[ReplacementTracker]:
+        """Build the replacement tracker for a draft state, or None without projections."""
+        arrays = catalog['value_arrays']
+        if not any(arrays.values()):
             return None
+        available = state['all_players']
+        open_slots = {group: sum(team_slots[group] for team_slots in state['open_slots']) for group in arrays}
+        taken = None
+        if len(available) < len(catalog['players']):
+            taken = {group: [index for index, (_, player_id) in enumerate(array) if player_id not in available]
+                     for group, array in arrays.items()}
+        return ReplacementTracker(arrays, open_slots, self.league, catalog['players'], taken)
+
+    def join_adp(self, players: List[Player], catalog: Dict[str, Any], matches: Dict[str, Tuple]):
+        """Attach each player's ADP row (or None), giving every ADP row to at most one player.
+
+        Players are matched against the ADP names without trigram similarity.
+        A row claimed by several players goes to the claim whose team agrees
+        with the row, then to the better match tier, then to the lower player
+        ID. A row left unclaimed is matched the other way round, against the
+        players still without ADP.
+        """
+        adp_data = catalog['adp']
+        adp_matcher = catalog['adp_matcher']
+        name_matcher = catalog['name_matcher']
+        row_names = adp_matcher.names
+        claims = {}  # ADP row position -> (preference, player ID, tier)
+        for player in players:
+            tier, positions = adp_matcher.match(player.name, similar=False)
+            if not positions:
+                continue
+            _, team = split_team(player.full_name)
+            position = next((position for position in positions if adp_data[row_names[position]]['team'] == team),
+                            positions[0])
+            preference = (adp_data[row_names[position]]['team'] != team, NAME_MATCH_TIERS.index(tier), player.id)
+            if position not in claims or preference < claims[position][0]:
+                claims[position] = (preference, player.id, tier)
+        for position, (_, player_id, _) in claims.items():
+            players[player_id].adp = adp_data[row_names[position]]
+
+        for position, row_name in enumerate(row_names):
+            if position in claims:
+                _, player_id, tier = claims[position]
+                self.record_name_match(matches, row_name, tier, [player_id], name_matcher)
+                continue
+            tier, candidates = name_matcher.match(row_name, lambda player_id: players[player_id].adp is None)
+            if candidates:
+                players[candidates[0]].adp = adp_data[row_name]
+            self.record_name_match(matches, row_name, tier, candidates[:1], name_matcher)
 
-        # Try exact match first
-        if player_name in self.state['adp']:
-            return self.state['adp'][player_name]
+    def record_name_match(self, matches: Dict[str, Tuple], name: str, tier: Optional[str], player_ids: List[int],
+                          name_matcher: NameMatcher):
+        """Add a reconciled name to a source's table unless it spells its player exactly.
 
-        # Try cleaned name
-        clean_name = re.sub(r'\s+(Jr\.?|Sr\.?|II|III|IV)$', '', player_name)
-        clean_name = re.sub(r'\s+\([^)]*\)', '', clean_name)  # Remove parentheses content
-        clean_name = clean_name.strip()
+        A name that matched nothing gets the closest player name as a suggestion.
+        """
+        if self.profiler is not None:
+            self.profiler.count('name_matches')
+        if tier == 'full' and name_matcher.names[player_ids[0]] == name:
+            return
+        suggestion = None
+        if tier is None:
+            score, candidates = name_matcher.similar(name_keys(name)[1], NAME_SUGGEST_THRESHOLD)
+            if candidates and score >= NAME_SUGGEST_THRESHOLD:
+                suggestion = (candidates[0], round(score, 2))
+        matches[name] = (tier, player_ids, suggestion)
+
+    def lookup_adp(self, player_name: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Look up ADP data for a name.
+
+        Catalog players have the row reconciled when the catalog was built.
+        Other names are matched against the ADP names once per draft and
+        cached in its state, hits and misses alike.
+        """
+        if not state.get('adp'):
+            return None
 
-        if clean_name in self.state['adp']:
-            return self.state['adp'][clean_name]
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.count('adp_lookups')
+        player_id = self.player_ids.get(player_name)
+        if player_id is not None:
+            return self.players[player_id].adp
+        adp_cache = state.setdefault('adp_cache', {})
+        if player_name in adp_cache:
+            return adp_cache[player_name]
+
+        if profiler is not None:
+            profiler.count('adp_name_matches')
+        adp_matcher = state['adp_matcher']
+        _, positions = adp_matcher.match(player_name)
+        adp_info = state['adp'][adp_matcher.names[positions[0]]] if positions else None
+        adp_cache[player_name] = adp_info
+        return adp_info
 
-        # Try fuzzy matching
-        for adp_name, adp_info in self.state['adp'].items():
-            if self.smarter_name_match(player_name, adp_name):
-                return adp_info
-            if self.smarter_name_match(player_name, adp_info.get('original_name', '')):
-                return adp_info
+    def get_player_adp(self, player_name: str) -> Optional[Dict[str, Any]]:
+        """Get ADP data for a player by name with fuzzy matching."""
+        return self.lookup_adp(player_name, self.state)
 
-        return None
+    def format_value(self, player: Player) -> str:
+        """Format a player's current value over replacement for display."""
+        valuation = self.state['valuation']
+        value = valuation.value(player) if valuation is not None else None
+        return f"{value:.2f}" if value is not None else "N/A"
 
     def format_adp(self, player_name: str) -> str:
         """Format ADP info for display."""
@@ -352,180 +1665,101 @@ class FantasyBaseballDraft:
 
     def generate_snake_order(self) -> List[List[int]]:
         """Generate a snake draft order."""
-        forward = list(range(8))
-        reverse = list(range(7, -1, -1))
+        forward = list(range(self.league.num_teams))
+        reverse = forward[::-1]
         return [forward, reverse]
 
-    def smarter_name_match(self, player_name: str, rank_name: str) -> bool:
-        """Advanced player name matching to handle variations."""
-        # Handle None values
-        if player_name is None or rank_name is None:
-            return False
-            
-        # Clean up player name
-        clean_player_name = player_name.strip()
-        clean_rank_name = rank_name.strip()
-        
-        # Direct match
-        if clean_player_name == clean_rank_name:
-            return True
-        
-        # Remove parentheses and their contents for comparison
-        player_no_parens = re.sub(r'\s*\([^)]*\)', '', clean_player_name)
-        rank_no_parens = re.sub(r'\s*\([^)]*\)', '', clean_rank_name)
-        
-        if player_no_parens.strip() == rank_no_parens.strip():
-            return True
-        
-        # Special case for Jr/II/III suffixes
-        player_base = re.sub(r'\s+(Jr|II|III)(\s+|$)', '', clean_player_name)
-        rank_base = re.sub(r'\s+(Jr|II|III)(\s+|$)', '', clean_rank_name)
-        
-        if player_base.strip() == rank_base.strip():
-            return True
-        
-        return False
+    def resolve_rank_list(self, rank_list: List[str], name_matcher: NameMatcher,
+                          matches: Optional[Dict[str, Tuple]] = None) -> List[List[int]]:
+        """Map each rank entry to the player IDs it matches, lowest ID first.
 
-    def is_eligible(self, team_id: int, player: Dict[str, Any]) -> bool:
+        Entries that match no player are dropped. An entry may match more than
+        one player (e.g. "Shohei Ohtani" matches "Shohei Ohtani (Batter)" and
+        "Shohei Ohtani (Pitcher)"), in which case the next candidate is used
+        once the first has been drafted. Reconciled names go in matches.
+        """
+        resolved = []
+        for rank_name in rank_list:
+            tier, candidates = name_matcher.match(rank_name)
+            if matches is not None:
+                self.record_name_match(matches, rank_name, tier, candidates, name_matcher)
+            if candidates:
+                resolved.append(candidates)
+        return resolved
+
+    def count_open_slots(self, team: Dict[str, Optional[int]]) -> Dict[str, int]:
+        """Count a team's empty roster slots in each slot group."""
+        open_slots = {group: 0 for group in self.slot_groups}
+        for slot, player_id in team.items():
+            if player_id is None:
+                open_slots[self.league.slot_group[slot]] += 1
+        return open_slots
+
+    def open_slot_mask(self, open_slots: Dict[str, int]) -> int:
+        """Build the mask of slot groups that still have an empty slot."""
+        mask = 0
+        for group, count in open_slots.items():
+            if count:
+                mask |= self.league.group_bits[group]
+        return mask
+
+    def is_eligible(self, team_id: int, player: Player) -> bool:
         """Check if a player is eligible for assignment to a team."""
-        team = self.state['teams'][team_id]
-        
-        # Check if player is UTIL/DH only
-        util_only = len(player['positions']) == 1 and (
-            player['positions'][0] == 'UTIL' or player['positions'][0] == 'DH'
-        )
-        
-        # For UTIL-only players, check only UTIL slots
-        if util_only:
-            for i in range(1, 3):
-                position_key = f'UTIL{i}'
-                if team[position_key] is None:
-                    return True
-            return False
-        
-        # For other players, check their eligible positions
-        for pos in player['positions']:
-            if pos == 'UTIL' or pos == 'DH':
-                continue  # Skip UTIL/DH in position checks, only use primary positions
-            
-            if pos == 'OF':
-                # Check all OF positions
-                for i in range(1, 4):
-                    position_key = f'OF{i}'
-                    if team[position_key] is None:
-                        return True
-            elif pos == 'SP':
-                # Check all SP positions
-                for i in range(1, 8):
-                    position_key = f'SP{i}'
-                    if team[position_key] is None:
-                        return True
-                # Check all P positions
-                for i in range(1, 6):
-                    position_key = f'P{i}'
-                    if team[position_key] is None:
-                        return True
-            elif pos == 'P' or pos == 'RP':
-                # Check all P positions
-                for i in range(1, 6):
-                    position_key = f'P{i}'
-                    if team[position_key] is None:
-                        return True
-            elif pos in team and team[pos] is None:
-                return True
-        
-        # If no primary positions are available but player is a batter, check UTIL slots
-        if 'P' not in player['positions'] and 'SP' not in player['positions']:
-            for i in range(1, 3):
-                position_key = f'UTIL{i}'
-                if team[position_key] is None:
-                    return True
-        
-        return False
+        return bool(player.mask & self.state['open_masks'][team_id])
 
-    def assign_player(self, team_id: int, player: Dict[str, Any], round_idx: int, pick: int):
-        """Assign a player to a team and update the draft grid."""
+    def assign_player(self, team_id: int, player: Player, round_idx: int, pick: int) -> Optional[str]:
+        """Assign a player to a team and update the draft grid. Returns the roster slot filled."""
         # Add player to draft grid
-        self.state['draft_grid'][round_idx][team_id] = {
-            'name': player['name'],
-            'team_id': team_id
-        }
-        
-        # Flag to track if player was assigned
-        assigned = False
+        self.state['draft_grid'][round_idx][team_id] = player.id
         
-        # STEP 1: Handle UTIL/DH only players first - they can only go to UTIL
-        util_only = len(player['positions']) == 1 and (
-            player['positions'][0] == 'UTIL' or player['positions'][0] == 'DH'
-        )
-        
-        if util_only:
-            for i in range(1, 3):
-                position_key = f'UTIL{i}'
-                if self.state['teams'][team_id][position_key] is None:
-                    self.state['teams'][team_id][position_key] = player
-                    assigned = True
-                    break
-            return  # Return early for UTIL-only players
-        
-        # STEP 2: Try standard positions first (C, 1B, 2B, SS, 3B)
-        for pos in player['positions']:
-            # Skip OF, UTIL, DH, SP, P positions for now
-            if pos in ['OF', 'UTIL', 'DH', 'SP', 'P']:
-                continue
-            
-            # Standard position check - direct assignment to matching position
-            if pos in self.state['teams'][team_id] and self.state['teams'][team_id][pos] is None:
-                self.state['teams'][team_id][pos] = player
-                assigned = True
-                break
-        
-        # STEP 3: Try OF positions if not yet assigned and player can play OF
-        if not assigned and 'OF' in player['positions']:
-            for i in range(1, 4):
-                position_key = f'OF{i}'
-                if self.state['teams'][team_id][position_key] is None:
-                    self.state['teams'][team_id][position_key] = player
-                    assigned = True
-                    break
+        team = self.state['teams'][team_id]
+        open_slots = self.state['open_slots'][team_id]
         
-        # STEP 4: Try pitching positions if not yet assigned
-        if not assigned:
-            is_pitcher = False
-            
-            # Check if player is a pitcher
-            for pos in player['positions']:
-                if pos == 'SP' or pos == 'P':
-                    is_pitcher = True
-                    break
+        # Fill the first slot group, in the player's preference order, with room left
+        for group in player.slot_order:
+            if open_slots[group]:
+                for position_key in self.slot_groups[group]:
+                    if team[position_key] is None:
+                        team[position_key] = player.id
+                        break
+                open_slots[group] -= 1
+                if not open_slots[group]:
+                    self.state['open_masks'][team_id] &= ~self.league.group_bits[group]
+                return position_key
+        return None
+
+    def overall_pick(self) -> int:
+        """Return the 0-based overall number of the current pick."""
+        return self.state['round'] * self.league.num_teams + self.state['pick']
+
+    def team_on_clock(self) -> int:
+        """Return the ID of the team making the current pick."""
+        return self.league.pick_order[self.overall_pick()]
+
+    def advance_pick(self):
+        """Move the draft on to the next pick, recording it in the journal if one is attached."""
+        history = self.state['history']
+        if len(history) == self.overall_pick():
+            # Nobody was drafted with this pick; keep a record so it can still be undone
+            history.append((self.state['round'], self.state['pick'], self.team_on_clock(), None, None))
+        self.state['redo'] = []
+        if self.journal is not None:
+            team_id = self.team_on_clock()
+            player_id = self.state['draft_grid'][self.state['round']][team_id]
+            self.journal.append({
+                'type': 'pick',
+                'round': self.state['round'],
+                'team': team_id,
+                'name': self.players[player_id].name if player_id is not None else None
+            })
+        self.state['pick'] += 1
+        if self.state['pick'] >= self.league.num_teams:
+            self.state['pick'] = 0
+            self.state['round'] += 1
             
-            if is_pitcher:
-                # First try SP slots if player is an SP
-                if 'SP' in player['positions']:
-                    for i in range(1, 8):
-                        position_key = f'SP{i}'
-                        if self.state['teams'][team_id][position_key] is None:
-                            self.state['teams'][team_id][position_key] = player
-                            assigned = True
-                            break
-                
-                # If still not assigned, try P slots
-                if not assigned:
-                    for i in range(1, 6):
-                        position_key = f'P{i}'
-                        if self.state['teams'][team_id][position_key] is None:
-                            self.state['teams'][team_id][position_key] = player
-                            assigned = True
-                            break
-        
-        # STEP 5: Last resort - assign to UTIL if player is a batter
-        if not assigned and 'P' not in player['positions'] and 'SP' not in player['positions']:
-            for i in range(1, 3):
-                position_key = f'UTIL{i}'
-                if self.state['teams'][team_id][position_key] is None:
-                    self.state['teams'][team_id][position_key] = player
-                    assigned = True
-                    break
+            # Check if draft is complete
+            if self.state['round'] >= self.league.num_rounds:
+                self.state['completed'] = True
 
     def draft_player(self):
         """Process one draft pick."""
@@ -533,101 +1767,211 @@ class FantasyBaseballDraft:
         if self.state['completed']:
             return
         
-        snake_order = self.generate_snake_order()
-        current_round = self.state['round']
-        current_pick = self.state['pick']
-        
-        # Use snake order to determine team picking
-        is_even_round = (current_round % 2 == 0)
-        team_order = snake_order[0] if is_even_round else snake_order[1]
-        team_id = team_order[current_pick]
+        team_id = self.team_on_clock()
+        profiler = self.profiler
+        if profiler is not None:
+            overall = self.overall_pick()
+            start = time.perf_counter()
         
         # Determine which strategy to use based on team
-        if team_id in TEAMS_USING_MY_RANK:
+        strategy = self.team_strategy(team_id)
+        if strategy == 'my_rank':
             # Use my ranking list
-            self.draft_using_rank_list(team_id, self.state['my_rank'], "my ranking list")
-        elif team_id in TEAMS_USING_THIRD_RANK:
+            self.draft_using_rank_list(team_id, 'my_rank', "my ranking list")
+        elif strategy == 'third_rank':
             # Use third-party ranking list
-            self.draft_using_rank_list(team_id, self.state['third_rank'], "third-party ranking list")
+            self.draft_using_rank_list(team_id, 'third_rank', "third-party ranking list")
         else:
             # For other teams, take best available player
             self.draft_best_available(team_id)
         
         # Move to next pick
-        self.state['pick'] += 1
-        if self.state['pick'] >= 8:
-            self.state['pick'] = 0
-            self.state['round'] += 1
-            
-            # Check if draft is complete
-            if self.state['round'] >= 22:
-                self.state['completed'] = True
+        self.advance_pick()
+        if profiler is not None:
+            profiler.record(f"pick:{strategy}", start, 'pick', {'overall': overall + 1, 'team': team_id + 1})
     
-    def draft_using_rank_list(self, team_id: int, rank_list: List[str], list_name: str):
-        """Draft a player using a specific ranking list."""
+    def team_strategy(self, team_id: int) -> str:
+        """Return the strategy a team drafts with: 'my_rank', 'third_rank' or 'best_available'."""
+        strategy = self.team_strategies.get(team_id)
+        return strategy if strategy in ('my_rank', 'third_rank') else 'best_available'
+
+    def make_pick(self, team_id: int, player: Player):
+        """Draft a player to a team with the current pick, recording it for undo."""
+        self.take_player(player)
+        slot = self.assign_player(team_id, player, self.state['round'], self.state['pick'])
+        self.state['history'].append((self.state['round'], self.state['pick'], team_id, player.id, slot))
+        if self.state['valuation'] is not None:
+            self.state['valuation'].pick(player, self.league.slot_group[slot] if slot else None)
+
+    def undo_pick(self) -> bool:
+        """Take back the most recent pick. Returns False if there is nothing to undo."""
+        state = self.state
+        if not state['history']:
+            return False
+        operation = state['history'].pop()
+        round_idx, pick, team_id, player_id, slot = operation
+        state['round'], state['pick'], state['completed'] = round_idx, pick, False
+        if player_id is not None:
+            state['draft_grid'][round_idx][team_id] = None
+            group = None
+            if slot is not None:
+                group = self.league.slot_group[slot]
+                state['teams'][team_id][slot] = None
+                state['open_slots'][team_id][group] += 1
+                state['open_masks'][team_id] |= self.league.group_bits[group]
+            self.return_player(self.players[player_id])
+            if state['valuation'] is not None:
+                state['valuation'].unpick(self.players[player_id], group)
+        state['redo'].append(operation)
+        if self.journal is not None:
+            self.journal.append({'type': 'undo'})
+        return True
+
+    def redo_pick(self) -> bool:
+        """Make the most recently undone pick again. Returns False if there is nothing to redo."""
+        pending = self.state['redo']
+        if not pending:
+            return False
+        _, _, team_id, player_id, _ = pending.pop()
+        if player_id is not None:
+            self.make_pick(team_id, self.players[player_id])
+        self.advance_pick()
+        # advance_pick drops the redo stack for new picks; keep the rest of it for redo
+        self.state['redo'] = pending
+        return True
+
+    def fork(self) -> 'FantasyBaseballDraft':
+        """Return an independent branch of this draft for playing out a what-if.
+
+        The branch shares the catalog and settings with this draft. Rosters,
+        grid and history are bounded by the league size and are copied; the
+        available pool is shared until either draft changes it. The branch
+        has no journal, so its picks never reach this draft's save file.
+        """
+        state = self.state
+        branch = object.__new__(type(self))
+        branch.__dict__.update(self.__dict__)
+        branch.journal = None
+        valuation = state['valuation']
+        branch.state = dict(
+            state,
+            all_players=state['all_players'].fork(),
+            draft_grid=[list(round_picks) for round_picks in state['draft_grid']],
+            teams=[dict(team) for team in state['teams']],
+            open_slots=[dict(team_slots) for team_slots in state['open_slots']],
+            open_masks=list(state['open_masks']),
+            cursors={name: cursor.copy() for name, cursor in state['cursors'].items()},
+            history=list(state['history']),
+            redo=list(state['redo']),
+            adp_cache={},
+            valuation=valuation.copy() if valuation is not None else None
+        )
+        return branch
+
+    def diff(self, other: 'FantasyBaseballDraft') -> Dict[str, Any]:
+        """Compare this draft with another branch of it.
+
+        Returns the overall pick (1-based) where the two pick histories first
+        differ, or None if they are the same, and one row per roster slot
+        that holds a different player, with each branch's player name.
+        """
+        if other.catalog is not self.catalog:
+            raise ValueError("Only branches of drafts sharing one catalog can be compared.")
+        history, other_history = self.state['history'], other.state['history']
+        diverged_at = next((overall for overall, (mine, theirs) in enumerate(zip(history, other_history))
+                            if mine != theirs), None)
+        if diverged_at is None and len(history) != len(other_history):
+            diverged_at = min(len(history), len(other_history))
+
+        def name(player_id: Optional[int]) -> Optional[str]:
+            return self.players[player_id].name if player_id is not None else None
+
+        rosters = []
+        for team_id, (team, other_team) in enumerate(zip(self.state['teams'], other.state['teams'])):
+            for slot in self.position_slots:
+                if team[slot] != other_team[slot]:
+                    rosters.append({'team': team_id + 1, 'slot': slot, 'this': name(team[slot]),
+                                    'other': name(other_team[slot])})
+        return {'diverged_at': diverged_at + 1 if diverged_at is not None else None, 'rosters': rosters}
+
+    def take_player(self, player: Player):
+        """Remove a player from the available pool."""
+        del self.state['all_players'][player.id]
+
+    def return_player(self, player: Player):
+        """Put an undrafted player back in the available pool and the pick cursors."""
+        self.state['all_players'][player.id] = player
+        for cursor in self.state['cursors'].values():
+            cursor.restore(player)
+
+    def draft_using_rank_list(self, team_id: int, rank_name: str, list_name: str):
+        """Draft a player using a ranking list ('my_rank' or 'third_rank')."""
         if self.state['completed']:
             return
                 
-        selected_player = None
-        print(f"\nDEBUG: Team {team_id+1} attempting to draft from {list_name}...")  # Debug line
-        print(f"DEBUG: Available players in list: {rank_list[:5]} (showing top 5)")  # Debug line
+        all_players = self.state['all_players']
+        open_mask = self.state['open_masks'][team_id]
+        if self.verbose or logger.isEnabledFor(logging.DEBUG):
+            self.log(logging.DEBUG, f"\nDEBUG: Team {team_id+1} attempting to draft from {list_name}...")
+            top_names = [self.players[candidate_ids[0]].name for candidate_ids in self.state[f'{rank_name}_ids'][:5]]
+            self.log(logging.DEBUG, f"DEBUG: Available players in list: {top_names} (showing top 5)")
         
-        # Try to find eligible player from the rank list
-        for rank_player_name in rank_list:
-            found_player = None
-            for player_name, player in list(self.state['all_players'].items()):
-                if self.smarter_name_match(player_name, rank_player_name):
-                    found_player = player
-                    break
-            
-            if found_player and self.is_eligible(team_id, found_player):
-                selected_player = found_player
-                for player_name, player in list(self.state['all_players'].items()):
-                    if self.smarter_name_match(player_name, rank_player_name):
-                        del self.state['all_players'][player_name]
-                        break
-                break
+        # Find the first eligible player from the rank list
+        selected_player = self.state['cursors'][rank_name].next_pick(all_players, open_mask, self.profiler)
         
+        team_name = f"Team {team_id + 1}"
+        if team_id == self.my_team_id:
+            team_name += " (Your Team)"
         if not selected_player:
-            print(f"Warning: No players from {list_name} are eligible for Team {team_id + 1}. Taking best available player.")
-            team_name = f"Team {team_id + 1}"
-            if team_id == self.my_team_id:
-                team_name += " (Your Team)"
-            print(f"Warning: No players from {list_name} are eligible for {team_name}. Taking best available player.")
+            self.log(logging.INFO,
+                     f"Warning: No players from {list_name} are eligible for {team_name}. Taking best available player.")
             # Select best available player
-            for player_name, player in list(self.state['all_players'].items()):
-                if self.is_eligible(team_id, player):
-                    selected_player = player
-                    del self.state['all_players'][player_name]
-                    break
+            selected_player = self.next_best_available(open_mask)
         
         # Assign the selected player
         if selected_player:
-            self.assign_player(team_id, selected_player, self.state['round'], self.state['pick'])
+            self.make_pick(team_id, selected_player)
         else:
-            print(f"Warning: No eligible players available for {team_name} at all! This is unusual.")
+            self.log(logging.INFO, f"Warning: No eligible players available for {team_name} at all! This is unusual.")
     
+    def next_best_available(self, open_mask: int) -> Optional[Player]:
+        """Return the best available player for the slot groups in open_mask.
+
+        With the 'projection' metric, projected players are ranked by their
+        current value over replacement; the static queue covers the rest.
+        """
+        valuation = self.state['valuation']
+        if self.value_metric == 'projection' and valuation is not None:
+            player = valuation.next_pick(open_mask)
+            if player is not None:
+                return player
+        return self.state['cursors']['best_available'].next_pick(self.state['all_players'], open_mask,
+                                                                  self.profiler)
+
     def draft_best_available(self, team_id: int):
         """Draft the best available player for a team."""
         if self.state['completed']:
             return
             
-        selected_player = None
-        # For teams using best available strategy, take best available player
-        for player_name, player in list(self.state['all_players'].items()):
-            if self.is_eligible(team_id, player):
-                # Found eligible player, assign them
-                selected_player = player
-                self.assign_player(team_id, player, self.state['round'], self.state['pick'])
-                del self.state['all_players'][player_name]
-                break
-                
-        if not selected_player:
+        self.draft_selected(team_id, self.next_best_available(self.state['open_masks'][team_id]))
+
+    def draft_from_cursor(self, team_id: int, cursor: DraftCursor):
+        """Draft the first available, eligible player from a cursor's order."""
+        if self.state['completed']:
+            return
+
+        self.draft_selected(team_id, cursor.next_pick(self.state['all_players'], self.state['open_masks'][team_id],
+                                                      self.profiler))
+
+    def draft_selected(self, team_id: int, player: Optional[Player]):
+        """Draft a chosen player, or warn if no eligible player was found."""
+        if player is not None:
+            self.make_pick(team_id, player)
+        else:
             team_name = f"Team {team_id + 1}"
             if team_id == self.my_team_id:
                 team_name += " (Your Team)"
-            print(f"Warning: No eligible players available for {team_name} at all! This is unusual.")
-        
+            self.log(logging.INFO, f"Warning: No eligible players available for {team_name} at all! This is unusual.")
 
     def display_draft_grid(self):
         """Display the current draft grid in the console."""
@@ -637,15 +1981,15 @@ class FantasyBaseballDraft:
         
         # Header row
         header = "Round"
-        for i in range(8):
+        for i in range(self.league.num_teams):
             team_name = f"Team {i+1}"
             
             # Add indicators for which ranking list each team uses
             if i == self.my_team_id:
                 team_name += " (You)"
-            if i in TEAMS_USING_MY_RANK:
+            if self.team_strategy(i) == 'my_rank':
                 team_name += "*"  # Mark teams using my rank
-            elif i in TEAMS_USING_THIRD_RANK:
+            elif self.team_strategy(i) == 'third_rank':
                 team_name += "^"  # Mark teams using third rank
                 
             header += f" | {team_name:12}"
@@ -657,8 +2001,8 @@ class FantasyBaseballDraft:
             row = f"Round {round_idx+1:2d}"
             
             for team_idx, pick in enumerate(round_picks):
-                if pick:
-                    player_name = pick['name']
+                if pick is not None:
+                    player_name = self.players[pick].name
                     # Truncate long names
                     if len(player_name) > 12:
                         player_name = player_name[:10] + ".."
@@ -683,18 +2027,16 @@ class FantasyBaseballDraft:
             current_round = self.state['round'] + 1
             
             # Determine which team is drafting next
-            is_even_round = (self.state['round'] % 2 == 0)
-            team_order = self.generate_snake_order()[0 if is_even_round else 1]
-            next_team = team_order[self.state['pick']] + 1  # +1 for display (1-based)
+            next_team = self.team_on_clock() + 1  # +1 for display (1-based)
             
             status = f"Current: Round {current_round}, Team {next_team}"
             if next_team - 1 == self.my_team_id:
                 status += " (You)"
                 
             # Add indicator for which ranking list the drafting team uses
-            if next_team - 1 in TEAMS_USING_MY_RANK:
+            if self.team_strategy(next_team - 1) == 'my_rank':
                 status += " - Using your ranking list"
-            elif next_team - 1 in TEAMS_USING_THIRD_RANK:
+            elif self.team_strategy(next_team - 1) == 'third_rank':
                 status += " - Using third-party ranking list"
             else:
                 status += " - Using best available player strategy"
@@ -713,9 +2055,9 @@ class FantasyBaseballDraft:
         indicators = []
         if team_id == self.my_team_id:
             indicators.append("YOUR TEAM")
-        if team_id in TEAMS_USING_MY_RANK:
+        if self.team_strategy(team_id) == 'my_rank':
             indicators.append("Using your rank list")
-        elif team_id in TEAMS_USING_THIRD_RANK:
+        elif self.team_strategy(team_id) == 'third_rank':
             indicators.append("Using third-party rank list")
         else:
             indicators.append("Using best available strategy")
@@ -730,10 +2072,11 @@ class FantasyBaseballDraft:
         print(f"{'Position':<10} | {'Player':<25} | {'ADP':>8} | {'Team':>5}")
         print("-" * 70)
 
-        for position, player in sorted(team.items()):
-            if player:
-                player_name = player['name']
-                adp_info = self.get_player_adp(player_name)
+        for position, player_id in sorted(team.items()):
+            if player_id is not None:
+                player = self.players[player_id]
+                player_name = player.name
+                adp_info = player.adp
                 if adp_info:
                     adp_str = f"{adp_info['adp']:.1f}"
                     team_str = adp_info.get('team', '')
@@ -748,74 +2091,199 @@ class FantasyBaseballDraft:
 
     def display_all_team_rosters(self):
         """Display all team rosters."""
-        for team_id in range(8):
+        for team_id in range(self.league.num_teams):
             self.display_team_roster(team_id)
 
-    def save_draft_state(self, filename: str = "draft_state.json"):
-        """Save the current draft state to a file."""
+    def snapshot_record(self) -> Dict[str, Any]:
+        """Return a journal snapshot of the draft. Players are stored by name
+        so journals stay valid if players.csv is reordered."""
+        def name_of(player_id: Optional[int]) -> Optional[str]:
+            return self.players[player_id].name if player_id is not None else None
+
+        return {
+            'type': 'snapshot',
+            'round': self.state['round'],
+            'pick': self.state['pick'],
+            'completed': self.state['completed'],
+            'draft_grid': [[name_of(player_id) for player_id in round_picks]
+                           for round_picks in self.state['draft_grid']],
+            'teams': [{pos: name_of(player_id) for pos, player_id in team.items()}
+                      for team in self.state['teams']]
+        }
+
+    def save_draft_state(self, filename: str = "draft_journal.jsonl", fsync: bool = False):
+        """Save the draft to a pick journal. Later picks are appended to it automatically."""
         try:
-            # Create a copy of the state that's safe to serialize
-            state_copy = {
-                'draft_grid': self.state['draft_grid'],
-                'round': self.state['round'],
-                'pick': self.state['pick'],
-                'completed': self.state['completed'],
-                # We need to handle the special serialization of team data
-                'teams': []
-            }
-            
-            # Handle teams data - convert player objects to names for JSON serialization
-            for team in self.state['teams']:
-                team_copy = {}
-                for pos, player in team.items():
-                    if player:
-                        team_copy[pos] = {
-                            'name': player['name'],
-                            'full_name': player.get('full_name', player['name']),
-                            'positions': player['positions']
-                        }
-                    else:
-                        team_copy[pos] = None
-                state_copy['teams'].append(team_copy)
-            
-            # Don't save all_players (we'll reload from source files)
-            # Save rank lists as ordered arrays of names
-            state_copy['my_rank'] = self.state['my_rank']
-            state_copy['third_rank'] = self.state['third_rank']
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(state_copy, f, indent=2, default=lambda o: str(o) if isinstance(o, object) else o)
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            header = {'type': 'header', 'version': JOURNAL_VERSION, 'league': self.league.to_dict()}
+            self.journal = PickJournal.create(filename, [header, self.snapshot_record()], fsync)
             print(f"Draft state saved to {filename}")
         except Exception as e:
             print(f"Error saving draft state: {e}")
 
-    def load_draft_state(self, filename: str = "draft_state.json"):
-        """Load draft state from a file."""
+    def restore_picks(self, draft_grid: List[List[Optional[str]]], teams: List[Dict[str, Optional[str]]],
+                      current_round: int, current_pick: int, completed: bool):
+        """Overlay saved picks (by player name) on a fresh state and remove those players from the pool."""
+        state = self.state
+        if len(draft_grid) > self.league.num_rounds or len(teams) != self.league.num_teams:
+            raise ValueError("the saved draft does not match the league configuration")
+        for round_idx, round_picks in enumerate(draft_grid):
+            for team_id, name in enumerate(round_picks):
+                if name is not None:
+                    state['draft_grid'][round_idx][team_id] = self.player_ids.get(name)
+        for team_id, team in enumerate(teams):
+            for pos, name in team.items():
+                if name is not None:
+                    state['teams'][team_id][pos] = self.player_ids.get(name)
+        state['open_slots'] = [self.count_open_slots(team) for team in state['teams']]
+        state['open_masks'] = [self.open_slot_mask(open_slots) for open_slots in state['open_slots']]
+
+        # Drafted players are no longer available
+        for round_picks in state['draft_grid']:
+            for player_id in round_picks:
+                if player_id is not None and player_id in state['all_players']:
+                    self.take_player(self.players[player_id])
+        state['valuation'] = self.replacement_tracker(state, self.catalog)
+
+        state['round'], state['pick'], state['completed'] = current_round, current_pick, completed
+
+        # Rebuild the undo history in pick order
+        for overall in range(min(self.overall_pick(), len(self.league.pick_order))):
+            team_id = self.league.pick_order[overall]
+            pick_round, pick_idx = divmod(overall, self.league.num_teams)
+            player_id = state['draft_grid'][pick_round][team_id]
+            slot = None
+            if player_id is not None:
+                slot = next((pos for pos, slot_player in state['teams'][team_id].items()
+                             if slot_player == player_id), None)
+            state['history'].append((pick_round, pick_idx, team_id, player_id, slot))
+
+    def replay_journal(self, records: List[Dict[str, Any]]) -> int:
+        """Rebuild the draft from journal records on top of a fresh state.
+
+        Replay starts from the last snapshot. Returns the number of picks replayed after it.
+        """
+        saved_league = LeagueConfig.from_dict(records[0].get('league', {}))
+        if saved_league != self.league:
+            raise ValueError("the saved draft was made for a different league configuration")
+
+        start = 0
+        for i, record in enumerate(records):
+            if record.get('type') == 'snapshot':
+                start = i
+        snapshot = records[start]
+        if snapshot.get('type') == 'snapshot':
+            self.restore_picks(snapshot['draft_grid'], snapshot['teams'],
+                               snapshot['round'], snapshot['pick'], snapshot['completed'])
+
+        replayed = 0
+        all_players = self.state['all_players']
+        for record in records[start + 1:]:
+            if record.get('type') == 'undo':
+                if not self.undo_pick():
+                    raise ValueError("journal undoes a pick that was never made")
+                replayed += 1
+                continue
+            if record.get('type') != 'pick':
+                continue
+            team_id = record['team']
+            if (self.state['completed'] or record['round'] != self.state['round']
+                    or team_id != self.team_on_clock()):
+                raise ValueError(f"journal pick for Team {team_id + 1} in round {record['round'] + 1} is out of order")
+            if record['name'] is not None:
+                player = all_players.get(self.player_ids.get(record['name']))
+                if player is None:
+                    raise ValueError(f"journal pick {record['name']} is unknown or already drafted")
+                self.make_pick(team_id, player)
+            self.advance_pick()
+            replayed += 1
+        return replayed
+
+    def restore_legacy_state(self, loaded_state: Dict[str, Any]):
+        """Restore a draft from the JSON state files written by older versions."""
+        # Saves without a league predate configurable leagues and used the default one
+        saved_league = LeagueConfig.from_dict(loaded_state.get('league', {}))
+        if saved_league != self.league:
+            raise ValueError("the saved draft was made for a different league configuration")
+
+        state = self.state
+        name_matcher = self.catalog['name_matcher']
+        my_rank = loaded_state.get('my_rank') or self.catalog['my_rank']
+        third_rank = loaded_state.get('third_rank') or self.catalog['third_rank']
+        state['my_rank'] = my_rank
+        state['third_rank'] = third_rank
+        state['my_rank_ids'] = self.resolve_rank_list(my_rank, name_matcher)
+        state['third_rank_ids'] = self.resolve_rank_list(third_rank, name_matcher)
+        state['cursors']['my_rank'] = DraftCursor(state['my_rank_ids'], self.league.group_bits)
+        state['cursors']['third_rank'] = DraftCursor(state['third_rank_ids'], self.league.group_bits)
+
+        self.restore_picks(
+            [[pick['name'] if pick else None for pick in round_picks] for round_picks in loaded_state['draft_grid']],
+            [{pos: player['name'] if player else None for pos, player in team.items()}
+             for team in loaded_state['teams']],
+            loaded_state['round'], loaded_state['pick'], loaded_state['completed']
+        )
+
+    def load_draft_state(self, filename: str = "draft_journal.jsonl"):
+        """Resume a draft by replaying a pick journal against the catalog.
+
+        JSON state files from older versions are still accepted. Picks made after
+        loading a journal are appended to it.
+        """
+        previous_state, previous_journal = self.state, self.journal
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                loaded_state = json.load(f)
-            
-            # Reload players from source files
-            players = self.load_players()
-            
-            # Reconstruct state with fresh player data but loaded draft progress
-            self.state = {
-                'all_players': players,
-                'my_rank': loaded_state.get('my_rank', self.load_my_rank()),
-                'third_rank': loaded_state.get('third_rank', self.load_third_rank()),
-                'draft_grid': loaded_state['draft_grid'],
-                'teams': loaded_state['teams'],
-                'round': loaded_state['round'],
-                'pick': loaded_state['pick'],
-                'completed': loaded_state['completed']
-            }
-            
+            records = PickJournal.read(filename)
+            self.state = self.initialize_draft(self.catalog)
+            self.journal = None
+            if records is None:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    self.restore_legacy_state(json.load(f))
+            else:
+                replayed = self.replay_journal(records)
+                if replayed >= JOURNAL_COMPACT_PICKS:
+                    # Fold the replayed picks into a new snapshot so the next load is quick
+                    self.journal = PickJournal.create(filename, [records[0], self.snapshot_record()])
+                else:
+                    self.journal = PickJournal(filename)
+            if previous_journal is not None and previous_journal is not self.journal:
+                previous_journal.close()
             print(f"Draft state loaded from {filename}")
         except FileNotFoundError:
+            self.state, self.journal = previous_state, previous_journal
             print(f"No saved draft state found at {filename}")
         except Exception as e:
+            self.state, self.journal = previous_state, previous_journal
             print(f"Error loading draft state: {e}")
 
+    def available_by_adp(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[float, int]]:
+        """Yield the (ADP, player ID) entries of available players from the catalog's ADP order.
+
+        start and stop bound the positions scanned in the full order.
+        """
+        order = self.state['adp_order']
+        available = self.state['all_players']
+        for index in range(start, len(order) if stop is None else stop):
+            if order[index][1] in available:
+                yield order[index]
+
+    def top_available_by_adp(self, count: int = 20) -> List[Dict[str, Any]]:
+        """Return the top available players by ADP as display rows."""
+        players_with_adp = []
+        for _, player_id in itertools.islice(self.available_by_adp(), count):
+            adp_info = self.players[player_id].adp
+            players_with_adp.append({
+                'name': self.players[player_id].name,
+                'adp': adp_info['adp'],
+                'rank': adp_info['rank'],
+                'team': adp_info.get('team', ''),
+                'pos': adp_info.get('pos', ''),
+                'best': adp_info.get('best'),
+                'worst': adp_info.get('worst'),
+                'vorp': self.format_value(self.players[player_id]),
+            })
+        return players_with_adp
 
     def display_top_available_by_adp(self, count: int = 20):
         """Display top available players sorted by ADP."""
@@ -823,93 +2291,378 @@ class FantasyBaseballDraft:
         print("TOP AVAILABLE PLAYERS BY ADP")
         print("=" * 85)
 
-        # Get available players with ADP
-        players_with_adp = []
-        for player_name, player in self.state['all_players'].items():
-            adp_info = self.get_player_adp(player_name)
-            if adp_info:
-                players_with_adp.append({
-                    'name': player_name,
-                    'player': player,
-                    'adp': adp_info['adp'],
-                    'rank': adp_info['rank'],
-                    'team': adp_info.get('team', ''),
-                    'pos': adp_info.get('pos', ''),
-                    'best': adp_info.get('best'),
-                    'worst': adp_info.get('worst'),
-                })
-
-        # Sort by ADP
-        players_with_adp.sort(key=lambda x: x['adp'])
+        players_with_adp = self.top_available_by_adp(count)
 
         # Display header
-        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Rank':>5} | {'Team':>5} | {'Pos':<8} | {'Best-Worst':<10}")
+        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Rank':>5} | {'Team':>5} | {'Pos':<8} | {'VORP':>6} | {'Best-Worst'}")
         print("-" * 85)
 
         # Display top N players
-        for i, p in enumerate(players_with_adp[:count], 1):
+        for i, p in enumerate(players_with_adp, 1):
             best_worst = f"{p['best']}-{p['worst']}" if p['best'] and p['worst'] else "N/A"
-            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {p['rank']:>5} | {p['team']:>5} | {p['pos']:<8} | {best_worst:<10}")
+            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {p['rank']:>5} | {p['team']:>5} | {p['pos']:<8} | {p['vorp']:>6} | {best_worst}")
 
         # Show count of players without ADP
-        players_without_adp = len(self.state['all_players']) - len(players_with_adp)
+        with_adp = sum(1 for _ in self.available_by_adp())
+        players_without_adp = len(self.state['all_players']) - with_adp
         print("-" * 85)
-        print(f"Total available: {len(self.state['all_players'])} | With ADP: {len(players_with_adp)} | Without ADP: {players_without_adp}")
+        print(f"Total available: {len(self.state['all_players'])} | With ADP: {with_adp} | Without ADP: {players_without_adp}")
         print("=" * 85 + "\n")
 
+    def adp_recommendations(self) -> Dict[str, Any]:
+        """Return the best value picks (ADP after the current pick) and the reaches (ADP before it)."""
+        current_overall_pick = self.overall_pick() + 1
+
+        # Split the ADP order around the current pick: reaches before, values after
+        order = self.state['adp_order']
+        available = self.state['all_players']
+        reach_end = bisect.bisect_left(order, (current_overall_pick,))
+        value_start = bisect.bisect_left(order, (current_overall_pick, float('inf')), reach_end)
+
+        def adp_row(entry: Tuple[float, int]) -> Dict[str, Any]:
+            adp, player_id = entry
+            adp_info = self.players[player_id].adp
+            # Value: positive = good value, negative = reach
+            return {
+                'name': self.players[player_id].name,
+                'adp': adp,
+                'value': adp - current_overall_pick,
+                'team': adp_info.get('team', ''),
+                'pos': adp_info.get('pos', ''),
+                'vorp': self.format_value(self.players[player_id]),
+            }
+
+        # Top value picks: the highest available ADPs, ties in players.csv order
+        value_tail = []
+        for index in range(len(order) - 1, value_start - 1, -1):
+            entry = order[index]
+            if entry[1] not in available:
+                continue
+            if len(value_tail) >= 10 and entry[0] != value_tail[-1][0]:
+                break
+            value_tail.append(entry)
+        value_tail.sort(key=lambda entry: (-entry[0], entry[1]))
+
+        # Potential reach picks (drafting earlier than ADP suggests)
+        return {
+            'overall_pick': current_overall_pick,
+            'value': [adp_row(entry) for entry in value_tail[:10]],
+            'reach': [adp_row(entry) for entry in itertools.islice(self.available_by_adp(0, reach_end), 5)]
+        }
+
     def display_adp_recommendations(self):
         """Display draft recommendations based on ADP value."""
         print("\n" + "=" * 85)
         print("ADP VALUE ANALYSIS - Best Available Picks")
         print("=" * 85)
 
-        current_overall_pick = (self.state['round'] * 8) + self.state['pick'] + 1
-
-        # Get available players with ADP
-        players_with_adp = []
-        for player_name, player in self.state['all_players'].items():
-            adp_info = self.get_player_adp(player_name)
-            if adp_info:
-                # Calculate value (positive = good value, negative = reach)
-                value = adp_info['adp'] - current_overall_pick
-                players_with_adp.append({
-                    'name': player_name,
-                    'adp': adp_info['adp'],
-                    'value': value,
-                    'team': adp_info.get('team', ''),
-                    'pos': adp_info.get('pos', ''),
-                })
-
-        # Sort by value (best values first - players with ADP higher than pick)
-        players_with_adp.sort(key=lambda x: -x['value'])
-
-        print(f"Current Pick: #{current_overall_pick}")
+        recommendations = self.adp_recommendations()
+        print(f"Current Pick: #{recommendations['overall_pick']}")
         print(f"\n{'BEST VALUE PICKS (ADP > Current Pick)':^85}")
-        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Value':>7} | {'Team':>5} | {'Pos':<8}")
+        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Value':>7} | {'Team':>5} | {'Pos':<8} | {'VORP':>6}")
         print("-" * 85)
 
-        # Show top value picks
-        value_picks = [p for p in players_with_adp if p['value'] > 0][:10]
+        value_picks = recommendations['value']
         for i, p in enumerate(value_picks, 1):
-            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {'+' if p['value'] > 0 else ''}{p['value']:>6.1f} | {p['team']:>5} | {p['pos']:<8}")
+            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {'+' if p['value'] > 0 else ''}{p['value']:>6.1f} | {p['team']:>5} | {p['pos']:<8} | {p['vorp']:>6}")
 
         if not value_picks:
             print("  No players available with ADP above current pick.")
 
         print(f"\n{'REACH PICKS (ADP < Current Pick)':^85}")
-        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Value':>7} | {'Team':>5} | {'Pos':<8}")
+        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Value':>7} | {'Team':>5} | {'Pos':<8} | {'VORP':>6}")
         print("-" * 85)
 
-        # Show potential reach picks (drafting earlier than ADP suggests)
-        reach_picks = [p for p in reversed(players_with_adp) if p['value'] < 0][:5]
+        reach_picks = recommendations['reach']
         for i, p in enumerate(reach_picks, 1):
-            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {p['value']:>7.1f} | {p['team']:>5} | {p['pos']:<8}")
+            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {p['value']:>7.1f} | {p['team']:>5} | {p['pos']:<8} | {p['vorp']:>6}")
 
         if not reach_picks:
             print("  All available players are good value at this pick!")
 
         print("=" * 85 + "\n")
 
+    def my_next_picks(self, turns: int = 2) -> List[int]:
+        """Return the 1-based overall picks of my next turns, not counting the current pick."""
+        order = self.league.pick_order
+        start = self.overall_pick()
+        if start < len(order) and order[start] == self.my_team_id:
+            start += 1
+        return list(itertools.islice((overall + 1 for overall in range(start, len(order))
+                                      if order[overall] == self.my_team_id), turns))
+
+    def adp_spread(self) -> Tuple[Any, Any, Any]:
+        """Return the IDs, ADPs and ADP standard deviations of the catalog's ADP players, in ADP order."""
+        return self.catalog['adp_spread']
+
+    def availability_odds(self, turns: int = 2, count: Optional[int] = None) -> Dict[str, Any]:
+        """Return the probability that each available ADP player lasts to each of my next turns.
+
+        The whole pool is computed at once; the rows are the first count
+        players by ADP, or all of them.
+        """
+        current_pick = self.overall_pick() + 1
+        my_picks = self.my_next_picks(turns)
+        player_ids, adps, stddevs = self.adp_spread()
+        flags = self.state['all_players'].flags
+        if np is not None:
+            available = np.frombuffer(flags, dtype=np.bool_)[player_ids]
+            player_ids, adps, stddevs = player_ids[available], adps[available], stddevs[available]
+        else:
+            available = [index for index, player_id in enumerate(player_ids) if flags[player_id]]
+            player_ids, adps, stddevs = ([column[index] for index in available]
+                                         for column in (player_ids, adps, stddevs))
+        odds = availability_probabilities(adps, stddevs, current_pick, my_picks)
+
+        columns = [column[:count] for column in (player_ids, adps, stddevs, *odds)]
+        if np is not None:
+            columns = [column.tolist() for column in columns]
+        rows = []
+        for player_id, adp, stddev, *available_odds in zip(*columns):
+            player = self.players[player_id]
+            rows.append({
+                'name': player.name,
+                'adp': adp,
+                'stddev': stddev,
+                'team': player.adp.get('team', ''),
+                'pos': player.adp.get('pos', ''),
+                'vorp': self.format_value(player),
+                'available': available_odds,
+            })
+        return {'overall_pick': current_pick, 'my_picks': my_picks, 'players': rows}
+
+    def display_availability_odds(self, count: int = 20):
+        """Display how likely the top available players by ADP are to last until my next two turns."""
+        print("\n" + "=" * 85)
+        print("AVAILABILITY AT MY NEXT PICKS")
+        print("=" * 85)
+
+        odds = self.availability_odds(count=count)
+        my_picks = odds['my_picks']
+        print(f"Current Pick: #{odds['overall_pick']} | My next picks: "
+              f"{', '.join(f'#{pick}' for pick in my_picks) or 'none'}")
+        if not my_picks:
+            print("  My team has no picks left.")
+            print("=" * 85 + "\n")
+            return
+
+        pick_headers = ''.join(f" | {'@' + str(pick):>6}" for pick in my_picks)
+        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'SD':>4} | {'Pos':<6}{pick_headers} | {'VORP':>6}")
+        print("-" * 85)
+        for i, p in enumerate(odds['players'], 1):
+            pick_odds = ''.join(f" | {chance:>6.0%}" for chance in p['available'])
+            print(f"{i:<4} | {p['name']:<25} | {p['adp']:>7.1f} | {p['stddev']:>4.1f} | {p['pos']:<6}{pick_odds} | {p['vorp']:>6}")
+
+        if not odds['players']:
+            print("  No players with ADP are available.")
+        print("=" * 85 + "\n")
+
+    def recommend_picks(self, time_budget: float = 3.0, max_depth: int = 4,
+                        width: int = 6) -> Dict[str, Any]:
+        """Rank candidate picks for my team with a lookahead search limited to time_budget seconds."""
+        return LookaheadSearch(self, width=width).run(time_budget, max_depth)
+
+    def display_pick_recommendations(self, time_budget: float = 3.0):
+        """Display lookahead pick recommendations for my team."""
+        results = self.recommend_picks(time_budget)
+
+        print("\n" + "=" * 85)
+        print(f"LOOKAHEAD PICK RECOMMENDATIONS - Team {self.my_team_id + 1} (Your Team)")
+        print("=" * 85)
+        if not results['candidates']:
+            print("  Your team has no picks left to make.")
+            print("=" * 85 + "\n")
+            return
+
+        print(f"Pick #{results['overall_pick'] + 1} | searched {results['depth']} of your turns ahead | "
+              f"{results['nodes']} nodes, {results['cache_hits']} cache hits in {results['elapsed']:.2f}s")
+        print("Value = projected roster value at the end of the draft (players drafted ahead of replacement-level ADP)")
+        print(f"{'#':<4} | {'Player':<25} | {'ADP':>7} | {'Value':>8} | {'vs Best':>8} | {'Pos':<8}")
+        print("-" * 85)
+        best_value = results['candidates'][0][1]
+        for i, (player_id, value) in enumerate(results['candidates'], 1):
+            player = self.players[player_id]
+            adp = f"{player.adp['adp']:.1f}" if player.adp else "N/A"
+            print(f"{i:<4} | {player.name:<25} | {adp:>7} | {value:>8.1f} | {value - best_value:>8.1f} | "
+                  f"{','.join(player.positions):<8}")
+        print("=" * 85 + "\n")
+
+
+class SearchTimeout(Exception):
+    """Raised inside a lookahead search when its time budget runs out."""
+
+
+class LookaheadSearch:
+    """Anytime lookahead search for the best pick for draft.my_team_id.
+
+    Opponents pick with their configured strategies (rank lists or best
+    available), which are deterministic given the board, so the tree only
+    branches on my team's picks. Each of my turns tries the top candidates
+    by ADP. Picks past the search horizon are played out with my team's own
+    strategy. The search deepens one of my turns at a time until the time
+    budget runs out and returns the deepest complete result. Picks are made
+    and taken back on the live draft with make_pick/undo_pick.
+    """
+
+    def __init__(self, draft: 'FantasyBaseballDraft', value_fn: Optional[Callable[[Player], float]] = None,
+                 width: int = 6):
+        self.draft = draft
+        self.team_id = draft.my_team_id
+        self.width = width
+        self.replacement_adp = draft.league.num_teams * draft.league.num_rounds
+        self.value_fn = value_fn or self.replacement_value
+        self.cache = {}  # (state hash, overall pick, depth) -> projected roster value
+        self.pick_keys = {}
+        self.rng = random.Random(0)
+        self.deadline = float('inf')
+        self.nodes = 0
+        self.cache_hits = 0
+
+    def replacement_value(self, player: Player) -> float:
+        """Picks by which a player's ADP beats the last pick of the draft."""
+        return adp_over_replacement(player, self.replacement_adp)
+
+    def pick_key(self, team_id: int, player_id: int) -> int:
+        """Random 64-bit key for a team drafting a player; the state hash XORs these together."""
+        key = self.pick_keys.get((team_id, player_id))
+        if key is None:
+            key = self.pick_keys[(team_id, player_id)] = self.rng.getrandbits(64)
+        return key
+
+    def history_hash(self, state_hash: int, start: int) -> int:
+        """Fold the picks made since history index start into a state hash."""
+        for _, _, team_id, player_id, _ in self.draft.state['history'][start:]:
+            if player_id is not None:
+                state_hash ^= self.pick_key(team_id, player_id)
+        return state_hash
+
+    def checkpoint(self) -> Tuple[int, Dict[str, Any]]:
+        """Remember the current position so the search can return to it."""
+        cursors = self.draft.state['cursors']
+        return len(self.draft.state['history']), {name: cursor.copy() for name, cursor in cursors.items()}
+
+    def rewind(self, checkpoint: Tuple[int, Dict[str, Any]]):
+        """Undo picks back to a checkpoint.
+
+        The cursors are restored from copies rather than rewound, which keeps
+        the cursors from scanning back over every undone rollout's players.
+        """
+        length, cursors = checkpoint
+        while len(self.draft.state['history']) > length:
+            self.draft.undo_pick()
+        self.draft.state['cursors'] = {name: cursor.copy() for name, cursor in cursors.items()}
+
+    def play_until_my_turn(self):
+        """Make the opponents' picks up to my team's next turn."""
+        draft = self.draft
+        while not draft.state['completed'] and draft.team_on_clock() != self.team_id:
+            draft.draft_player()
+
+    def roster_value(self) -> float:
+        """Value of the players currently on my team."""
+        players = self.draft.players
+        return sum(self.value_fn(players[player_id])
+                   for player_id in self.draft.state['teams'][self.team_id].values() if player_id is not None)
+
+    def candidates(self) -> List[int]:
+        """Top available players by ADP that fit my open slots, plus the best for each uncovered slot group."""
+        state = self.draft.state
+        open_mask = state['open_masks'][self.team_id]
+        all_players = state['all_players']
+        chosen = []
+        covered = 0
+        for _, player_id in self.draft.available_by_adp():
+            fits = all_players[player_id].mask & open_mask
+            if not fits:
+                continue
+            if len(chosen) < self.width or fits & ~covered:
+                chosen.append(player_id)
+                covered |= fits
+            if len(chosen) >= self.width and covered == open_mask:
+                break
+        return chosen
+
+    def search(self, depth: int, state_hash: int) -> float:
+        """Projected roster value from my turn, branching on my next depth turns."""
+        draft = self.draft
+        self.nodes += 1
+        if draft.state['completed']:
+            return self.roster_value()
+        key = (state_hash, draft.overall_pick(), depth)
+        value = self.cache.get(key)
+        if value is not None:
+            self.cache_hits += 1
+            return value
+        if time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        candidates = self.candidates() if depth > 0 else []
+        if candidates:
+            value = max(self.child_value(player_id, depth - 1, state_hash) for player_id in candidates)
+        else:
+            # Past the horizon: play the rest of the draft out with every team's strategy
+            checkpoint = self.checkpoint()
+            while not draft.state['completed']:
+                draft.draft_player()
+            value = self.roster_value()
+            self.rewind(checkpoint)
+        self.cache[key] = value
+        return value
+
+    def child_value(self, player_id: int, depth: int, state_hash: int) -> float:
+        """Projected roster value if my team drafts player_id now."""
+        draft = self.draft
+        checkpoint = self.checkpoint()
+        draft.make_pick(self.team_id, draft.players[player_id])
+        draft.advance_pick()
+        self.play_until_my_turn()
+        value = self.search(depth, self.history_hash(state_hash, checkpoint[0]))
+        self.rewind(checkpoint)
+        return value
+
+    def run(self, time_budget: float, max_depth: int = 4) -> Dict[str, Any]:
+        """Search until time_budget seconds have passed or max_depth of my turns are covered.
+
+        Returns the candidates as (player ID, projected value) pairs, best first,
+        along with the depth reached and search counters. The draft is left as it was.
+        """
+        draft = self.draft
+        start = time.perf_counter()
+        self.deadline = start + time_budget
+        saved = (draft.verbose, draft.journal, draft.state['redo'])
+        draft.verbose, draft.journal = False, None
+        root = self.checkpoint()
+        results, depth_reached, overall_pick = [], 0, draft.overall_pick()
+        try:
+            self.play_until_my_turn()
+            overall_pick = draft.overall_pick()
+            candidates = self.candidates() if not draft.state['completed'] else []
+            remaining_turns = draft.league.pick_order[overall_pick:].count(self.team_id)
+            state_hash = self.history_hash(0, 0)
+            for depth in range(min(max_depth, remaining_turns)):
+                values = {}
+                try:
+                    for player_id in candidates:
+                        values[player_id] = self.child_value(player_id, depth, state_hash)
+                except SearchTimeout:
+                    # Fall back to a partial first pass only if nothing finished
+                    if not results:
+                        results = sorted(values.items(), key=lambda item: -item[1])
+                    break
+                results = sorted(values.items(), key=lambda item: -item[1])
+                depth_reached = depth + 1
+        finally:
+            self.rewind(root)
+            draft.verbose, draft.journal, draft.state['redo'] = saved
+        return {
+            'candidates': results,
+            'depth': depth_reached,
+            'overall_pick': overall_pick,
+            'nodes': self.nodes,
+            'cache_hits': self.cache_hits,
+            'elapsed': time.perf_counter() - start
+        }
+
 
 def auto_complete_draft(draft):
     """Automatically complete the entire draft."""
@@ -924,9 +2677,496 @@ def auto_complete_draft(draft):
 
     print("Draft completed!")
 
+
+def profile_draft(filename: str, trace_format: str = 'json', use_cache: bool = False) -> DraftProfiler:
+    """Load the inputs and auto-complete a draft with a profiler attached, then save the profile.
+
+    The input cache is bypassed by default so the loaders show up in the profile.
+    """
+    profiler = DraftProfiler()
+    draft = FantasyBaseballDraft(verbose=False, league=load_league_config(), profiler=profiler)
+    with profiler.span('load_catalog', 'load'):
+        draft.use_catalog(draft.load_catalog(use_cache=use_cache))
+    with profiler.span('initialize_draft', 'load'):
+        draft.state
+    with profiler.span('auto_complete_draft'):
+        auto_complete_draft(draft)
+    profiler.save(filename, trace_format)
+    return profiler
+
+
+def adp_sampling_plan(players: AvailablePlayers) -> Tuple[Any, ...]:
+    """Gather what sample_adp_order needs from the available players, once per starting pool.
+
+    Returns the IDs, ADPs, ADP standard deviations and best/worst observed
+    picks of the players with ADP data (numpy arrays when numpy is
+    installed), and the players without it as cursor entries.
+    """
+    player_ids, adps, stddevs, bests, worsts, unranked = [], [], [], [], [], []
+    for player_id, player in players.items():
+        adp_info = player.adp
+        if not adp_info:
+            unranked.append((player_id,))
+            continue
+        best, worst = adp_info.get('best'), adp_info.get('worst')
+        player_ids.append(player_id)
+        adps.append(adp_info['adp'])
+        stddevs.append(adp_info.get('stddev') or 0.0)
+        bests.append(best if best is not None else float('-inf'))
+        worsts.append(worst if worst is not None else float('inf'))
+    if np is not None:
+        return (np.array(player_ids, dtype=np.intp), np.array(adps), np.array(stddevs), np.array(bests),
+                np.array(worsts), unranked)
+    return player_ids, adps, stddevs, bests, worsts, unranked
+
+
+def sample_adp_order(plan: Tuple[Any, ...], rng: random.Random) -> List[Tuple[int]]:
+    """Order players by a draft position sampled from each one's ADP distribution, as cursor entries.
+
+    Each position is drawn from a normal distribution around the player's
+    ADP with their ADP standard deviation, clamped to their best/worst
+    observed pick; ties go to the lower player ID. Players without ADP data
+    go last, in players.csv order. With numpy every position is drawn in one
+    call, from a generator seeded by rng.
+    """
+    player_ids, adps, stddevs, bests, worsts, unranked = plan
+    if np is not None:
+        sampler = np.random.default_rng(rng.getrandbits(64))
+        values = np.clip(sampler.normal(adps, stddevs), bests, worsts)
+        order = player_ids[np.lexsort((player_ids, values))]
+        return [(player_id,) for player_id in order.tolist()] + unranked
+
+    keyed = [(min(max(rng.gauss(adp, stddev), best), worst), player_id)
+             for player_id, adp, stddev, best, worst in zip(player_ids, adps, stddevs, bests, worsts)]
+    keyed.sort()
+    return [(player_id,) for _, player_id in keyed] + unranked
+
+
+def simulate_single_draft(draft: FantasyBaseballDraft, rng: random.Random,
+                          plan: Optional[Tuple[Any, ...]] = None) -> List[Tuple[int, Optional[int]]]:
+    """Run one draft where every team except draft.my_team_id picks stochastically by ADP.
+
+    The user's team drafts with its configured strategy. plan is the draft's
+    adp_sampling_plan, built here if not given. Returns a (team ID, player ID)
+    pair for every pick in overall pick order.
+    """
+    if plan is None:
+        plan = adp_sampling_plan(draft.state['all_players'])
+    cursor = DraftCursor(sample_adp_order(plan, rng), draft.league.group_bits)
+    picks = []
+    while not draft.state['completed']:
+        team_id = draft.team_on_clock()
+        round_idx = draft.state['round']
+        if team_id == draft.my_team_id:
+            draft.draft_player()
+        else:
+            draft.draft_from_cursor(team_id, cursor)
+            draft.advance_pick()
+        picks.append((team_id, draft.state['draft_grid'][round_idx][team_id]))
+    return picks
+
+
+# Per-process state for simulation workers, set once by _init_simulation_worker
+_SIMULATION_WORKER = {}
+
+
+def _init_simulation_worker(catalog: Dict[str, Any], my_team_id: int, team_strategies: Dict[int, str]):
+    """Receive the parsed catalog and team configuration once per worker process."""
+    _SIMULATION_WORKER['catalog'] = catalog
+    _SIMULATION_WORKER['my_team_id'] = my_team_id
+    _SIMULATION_WORKER['team_strategies'] = team_strategies
+
+
+def _run_simulation_batch(seeds: List[int]) -> Dict[str, Any]:
+    """Run one batch of simulated drafts with the worker's catalog and team configuration."""
+    return run_simulation_batch(_SIMULATION_WORKER['catalog'], _SIMULATION_WORKER['my_team_id'],
+                                _SIMULATION_WORKER['team_strategies'], seeds)
+
+
+def run_simulation_batch(catalog: Dict[str, Any], my_team_id: int, team_strategies: Dict[int, str],
+                         seeds: List[int]) -> Dict[str, Any]:
+    """Run one simulated draft per seed and return summed outcome counts.
+
+    Only drafted players are tallied; every other player was available at
+    all of my picks in every draft of the batch.
+    """
+    taken_before = {}      # player ID -> count of drafts taken before each of my picks
+    on_my_team = {}        # player ID -> count of drafts ending on my roster
+    pick_totals = {}       # player ID -> [sum of overall pick numbers, times drafted]
+    slot_counts = {}       # roster slot -> player ID -> count
+    my_picks = None
+    plan = None
+
+    for seed in seeds:
+        draft = FantasyBaseballDraft(my_team_id=my_team_id, catalog=catalog, verbose=False,
+                                     team_strategies=team_strategies)
+        if plan is None:
+            plan = adp_sampling_plan(draft.state['all_players'])
+        picks = simulate_single_draft(draft, random.Random(seed), plan)
+
+        if my_picks is None:
+            my_picks = [overall for overall, (team_id, _) in enumerate(picks) if team_id == my_team_id]
+        for overall, (_, player_id) in enumerate(picks):
+            if player_id is None:
+                continue
+            # My picks are in order, so a player gone before one is gone before the rest
+            first_missed = bisect.bisect_right(my_picks, overall)
+            if first_missed < len(my_picks):
+                counts = taken_before.get(player_id)
+                if counts is None:
+                    counts = taken_before[player_id] = [0] * len(my_picks)
+                for i in range(first_missed, len(my_picks)):
+                    counts[i] += 1
+            totals = pick_totals.setdefault(player_id, [0, 0])
+            totals[0] += overall + 1
+            totals[1] += 1
+
+        for slot, player_id in draft.state['teams'][my_team_id].items():
+            if player_id is not None:
+                on_my_team[player_id] = on_my_team.get(player_id, 0) + 1
+                slot_players = slot_counts.setdefault(slot, {})
+                slot_players[player_id] = slot_players.get(player_id, 0) + 1
+
+    return {
+        'drafts': len(seeds),
+        'my_picks': my_picks or [],
+        'taken_before': taken_before,
+        'on_my_team': on_my_team,
+        'pick_totals': pick_totals,
+        'slot_counts': slot_counts
+    }
+
+
+def simulate_drafts(num_drafts: int = 1000, seed: Optional[int] = None, workers: Optional[int] = None,
+                    my_team_id: int = MY_TEAM_ID, catalog: Optional[Dict[str, Any]] = None,
+                    team_strategies: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+    """Run many Monte Carlo drafts across a process pool and aggregate the outcomes.
+
+    Opponents pick stochastically from the ADP distribution; the user's team
+    uses its strategy from team_strategies (default: build_team_strategies of the
+    module defaults). Every draft gets its own seed derived from `seed`, so
+    results are reproducible regardless of the number of workers.
+    """
+    if catalog is None:
+        catalog = FantasyBaseballDraft(my_team_id=my_team_id, verbose=False).catalog
+    if team_strategies is None:
+        team_strategies = build_team_strategies(TEAMS_USING_MY_RANK, TEAMS_USING_THIRD_RANK)
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_simulation_worker,
+                             initargs=(catalog, my_team_id, team_strategies)) as executor:
+        batch_results = list(executor.map(_run_simulation_batch, simulation_batches(num_drafts, seed, workers)))
+    elapsed = time.perf_counter() - start
+    return summarize_simulations(catalog, batch_results, num_drafts, seed, workers, my_team_id, elapsed)
+
+
+def simulation_batches(num_drafts: int, seed: Optional[int], workers: int) -> List[List[int]]:
+    """Derive one seed per draft from `seed` and split them into about four batches per worker."""
+    seed_rng = random.Random(seed)
+    draft_seeds = [seed_rng.getrandbits(64) for _ in range(num_drafts)]
+    batch_size = max(1, -(-num_drafts // (workers * 4)))
+    return [draft_seeds[i:i + batch_size] for i in range(0, num_drafts, batch_size)]
+
+
+def summarize_simulations(catalog: Dict[str, Any], batch_results: List[Dict[str, Any]], num_drafts: int,
+                          seed: Optional[int], workers: int, my_team_id: int, elapsed: float) -> Dict[str, Any]:
+    """Combine run_simulation_batch results into the simulate_drafts report."""
+    # Sum the per-batch counts
+    my_picks = []
+    taken_before = {}
+    on_my_team = {}
+    pick_totals = {}
+    slot_counts = {}
+    for result in batch_results:
+        my_picks = my_picks or result['my_picks']
+        for player_id, counts in result['taken_before'].items():
+            totals = taken_before.setdefault(player_id, [0] * len(counts))
+            for i, count in enumerate(counts):
+                totals[i] += count
+        for player_id, count in result['on_my_team'].items():
+            on_my_team[player_id] = on_my_team.get(player_id, 0) + count
+        for player_id, (pick_sum, times) in result['pick_totals'].items():
+            totals = pick_totals.setdefault(player_id, [0, 0])
+            totals[0] += pick_sum
+            totals[1] += times
+        for slot, slot_players in result['slot_counts'].items():
+            slot_totals = slot_counts.setdefault(slot, {})
+            for player_id, count in slot_players.items():
+                slot_totals[player_id] = slot_totals.get(player_id, 0) + count
+
+    # Report by player name; a player never taken early was available at every pick
+    players = {}
+    never_taken = [0] * len(my_picks)
+    for player in (catalog['players'] if batch_results else ()):
+        player_id = player.id
+        pick_sum, times = pick_totals.get(player_id, (0, 0))
+        players[player.name] = {
+            'availability': [(num_drafts - taken) / num_drafts
+                             for taken in taken_before.get(player_id, never_taken)],
+            'on_my_team': on_my_team.get(player_id, 0) / num_drafts,
+            'drafted_rate': times / num_drafts,
+            'avg_pick': pick_sum / times if times else None
+        }
+
+    roster = {}
+    for slot, slot_players in slot_counts.items():
+        roster[slot] = {catalog['players'][player_id].name: count / num_drafts
+                        for player_id, count in sorted(slot_players.items(), key=lambda x: -x[1])}
+
+    return {
+        'drafts': num_drafts,
+        'seed': seed,
+        'workers': workers,
+        'my_team_id': my_team_id,
+        'my_picks': [pick + 1 for pick in my_picks],
+        'elapsed': elapsed,
+        'drafts_per_second': num_drafts / elapsed if elapsed > 0 else float('inf'),
+        'players': players,
+        'roster': roster
+    }
+
+
+def display_simulation_results(results: Dict[str, Any], count: int = 15):
+    """Display a summary of simulate_drafts results for the user's team."""
+    print("\n" + "=" * 85)
+    print(f"MONTE CARLO SIMULATION - Team {results['my_team_id'] + 1}")
+    print("=" * 85)
+    print(f"Drafts: {results['drafts']} | Workers: {results['workers']} | Seed: {results['seed']} | "
+          f"Time: {results['elapsed']:.2f}s | {results['drafts_per_second']:.0f} drafts/sec")
+
+    # Most likely roster outcomes
+    players = results['players']
+    ranked = sorted(players.items(), key=lambda x: -x[1]['on_my_team'])
+    print(f"\n{'MOST LIKELY ON YOUR ROSTER':^85}")
+    print(f"{'#':<4} | {'Player':<25} | {'On Team':>8} | {'Avg Pick':>8} | {'Avail @ 1st':>11} | {'Avail @ 2nd':>11}")
+    print("-" * 85)
+    for i, (player_name, outcome) in enumerate(ranked[:count], 1):
+        if outcome['on_my_team'] <= 0:
+            break
+        availability = outcome['availability'] + [0.0, 0.0]
+        avg_pick = f"{outcome['avg_pick']:.1f}" if outcome['avg_pick'] is not None else "N/A"
+        print(f"{i:<4} | {player_name:<25} | {outcome['on_my_team']:>7.1%} | {avg_pick:>8} | "
+              f"{availability[0]:>10.1%} | {availability[1]:>10.1%}")
+    print("=" * 85 + "\n")
+
+
+STRATEGIES = ('my_rank', 'third_rank', 'best_available')
+
+# Opponent mixes for the tournament: every other team uses one strategy, or
+# 'configured' keeps the team strategies passed to run_tournament
+OPPONENT_MIXES = ('configured',) + STRATEGIES
+
+
+def adp_roster_score(draft: FantasyBaseballDraft, team_id: int) -> float:
+    """Score a roster by the picks each player's ADP beats the last pick of the draft by."""
+    replacement_adp = draft.league.num_teams * draft.league.num_rounds
+    return sum(adp_over_replacement(draft.players[player_id], replacement_adp)
+               for player_id in draft.state['teams'][team_id].values() if player_id is not None)
+
+
+def projection_roster_score(draft: FantasyBaseballDraft, team_id: int) -> float:
+    """Score a roster by its players' pre-draft projected value over replacement."""
+    return sum(draft.players[player_id].value or 0.0
+               for player_id in draft.state['teams'][team_id].values() if player_id is not None)
+
+
+# Roster scorers for the tournament, called as scorer(draft, team_id) (higher is better)
+ROSTER_SCORERS: Dict[str, Callable[[FantasyBaseballDraft, int], float]] = {
+    'adp': adp_roster_score,
+    'projection': projection_roster_score
+}
+
+
+def tournament_strategies(strategy: str, team_id: int, mix: str, num_teams: int,
+                          configured: Dict[int, str]) -> Dict[int, str]:
+    """Build the team strategy map for one tournament draft."""
+    strategies = {}
+    for other_id in range(num_teams):
+        if mix != 'configured':
+            strategies[other_id] = mix
+        else:
+            strategies[other_id] = configured.get(other_id, 'best_available')
+    strategies[team_id] = strategy
+    return strategies
+
+
+# Per-process state for tournament workers, set once by _init_tournament_worker
+_TOURNAMENT_WORKER = {}
+
+
+def _init_tournament_worker(catalog: Dict[str, Any], scorer: Callable[[FantasyBaseballDraft, int], float],
+                            value_metric: str, configured: Dict[int, str]):
+    """Receive the parsed catalog, scorer and team configuration once per worker process."""
+    _TOURNAMENT_WORKER['configured'] = configured
+    _TOURNAMENT_WORKER['catalog'] = catalog
+    _TOURNAMENT_WORKER['scorer'] = scorer
+    _TOURNAMENT_WORKER['value_metric'] = value_metric
+
+
+def _run_tournament_batch(matches: List[Tuple[str, int, str]]) -> List[Tuple[str, int, str, float, int]]:
+    """Draft each (strategy, team ID, opponent mix) match and score the tested team.
+
+    Returns (strategy, team ID, mix, score, finishing place among all teams) per match.
+    """
+    catalog = _TOURNAMENT_WORKER['catalog']
+    scorer = _TOURNAMENT_WORKER['scorer']
+    num_teams = catalog['league'].num_teams
+
+    results = []
+    for strategy, team_id, mix in matches:
+        draft = FantasyBaseballDraft(my_team_id=team_id, catalog=catalog, verbose=False,
+                                     value_metric=_TOURNAMENT_WORKER['value_metric'],
+                                     team_strategies=tournament_strategies(strategy, team_id, mix, num_teams,
+                                                                           _TOURNAMENT_WORKER['configured']))
+        while not draft.state['completed']:
+            draft.draft_player()
+        scores = [scorer(draft, other_id) for other_id in range(num_teams)]
+        place = 1 + sum(score > scores[team_id] for score in scores)
+        results.append((strategy, team_id, mix, scores[team_id], place))
+    return results
+
+
+def run_tournament(catalog: Optional[Dict[str, Any]] = None, scorer: Union[str, Callable] = 'adp',
+                   strategies: Tuple[str, ...] = STRATEGIES, mixes: Tuple[str, ...] = OPPONENT_MIXES,
+                   value_metric: str = 'adp', workers: Optional[int] = None,
+                   configured: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+    """Draft every (strategy, draft slot, opponent mix) combination across a process pool.
+
+    scorer is a ROSTER_SCORERS name or a picklable function scorer(draft, team_id).
+    configured is the team strategy map used by the 'configured' mix. The catalog
+    is sent to each worker once. Returns the scores and finishing places as
+    matrices indexed [mix][strategy][team ID].
+    """
+    if catalog is None:
+        catalog = FantasyBaseballDraft(verbose=False).catalog
+    if configured is None:
+        configured = build_team_strategies(TEAMS_USING_MY_RANK, TEAMS_USING_THIRD_RANK)
+    if isinstance(scorer, str):
+        scorer = ROSTER_SCORERS[scorer]
+    num_teams = catalog['league'].num_teams
+    workers = workers or os.cpu_count() or 1
+
+    matches = [(strategy, team_id, mix) for mix in mixes for strategy in strategies for team_id in range(num_teams)]
+    batch_size = max(1, -(-len(matches) // (workers * 4)))
+    batches = [matches[i:i + batch_size] for i in range(0, len(matches), batch_size)]
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_tournament_worker,
+                             initargs=(catalog, scorer, value_metric, configured)) as executor:
+        batch_results = list(executor.map(_run_tournament_batch, batches))
+    elapsed = time.perf_counter() - start
+
+    scores = {mix: {strategy: [None] * num_teams for strategy in strategies} for mix in mixes}
+    places = {mix: {strategy: [None] * num_teams for strategy in strategies} for mix in mixes}
+    for results in batch_results:
+        for strategy, team_id, mix, score, place in results:
+            scores[mix][strategy][team_id] = score
+            places[mix][strategy][team_id] = place
+
+    return {
+        'drafts': len(matches),
+        'workers': workers,
+        'elapsed': elapsed,
+        'scorer': getattr(scorer, '__name__', str(scorer)),
+        'strategies': list(strategies),
+        'mixes': list(mixes),
+        'num_teams': num_teams,
+        'scores': scores,
+        'places': places
+    }
+
+
+def display_tournament_results(results: Dict[str, Any]):
+    """Display the tournament score matrix: one table per opponent mix, strategies by draft slot."""
+    num_teams = results['num_teams']
+    print("\n" + "=" * 85)
+    print("STRATEGY TOURNAMENT")
+    print("=" * 85)
+    print(f"Drafts: {results['drafts']} | Workers: {results['workers']} | Scorer: {results['scorer']} | "
+          f"Time: {results['elapsed']:.2f}s")
+
+    for mix in results['mixes']:
+        print(f"\nOpponents: {mix}")
+        header = f"{'Strategy':<15}" + "".join(f" | {'Slot ' + str(i + 1):>7}" for i in range(num_teams))
+        header += f" | {'Avg':>7} | {'Place':>5}"
+        print(header)
+        print("-" * len(header))
+        for strategy in results['strategies']:
+            scores = results['scores'][mix][strategy]
+            places = results['places'][mix][strategy]
+            row = f"{strategy:<15}" + "".join(f" | {score:>7.1f}" for score in scores)
+            print(row + f" | {sum(scores) / num_teams:>7.1f} | {sum(places) / num_teams:>5.1f}")
+    print("=" * 85 + "\n")
+
+
+def what_if_picks(draft: FantasyBaseballDraft, player_names: Sequence[str]) -> List[FantasyBaseballDraft]:
+    """Play the rest of the draft once per named player taken with the current pick.
+
+    Each player gets a fork of the draft, and the team strategies draft the
+    rest of it. The draft itself is left untouched. Raises ValueError for an
+    unknown, drafted or ineligible player.
+    """
+    if draft.state['completed']:
+        raise ValueError("The draft is already complete.")
+    team_id = draft.team_on_clock()
+    branches = []
+    for name in player_names:
+        player_id = draft.player_ids.get(name)
+        if player_id is None:
+            raise ValueError(f"Unknown player '{name}'.")
+        if player_id not in draft.state['all_players']:
+            raise ValueError(f"{name} has already been drafted.")
+        if not draft.is_eligible(team_id, draft.players[player_id]):
+            raise ValueError(f"Team {team_id + 1} has no open slot for {name}.")
+        branch = draft.fork()
+        branch.verbose = False
+        branch.make_pick(team_id, draft.players[player_id])
+        branch.advance_pick()
+        while not branch.state['completed']:
+            branch.draft_player()
+        branches.append(branch)
+    return branches
+
+
+def display_what_if(draft: FantasyBaseballDraft, player_names: Sequence[str], branches: List[FantasyBaseballDraft]):
+    """Display each what-if branch's final roster scores and how its roster differs from the first branch."""
+    team_id = draft.team_on_clock()
+    print("\n" + "=" * 85)
+    print(f"WHAT-IF: TEAM {team_id + 1} AT PICK #{draft.overall_pick() + 1}")
+    print("=" * 85)
+    print(f"{'Pick':<25} | {'ADP score':>10} | {'Projected value':>15}")
+    print("-" * 85)
+    for name, branch in zip(player_names, branches):
+        print(f"{name:<25} | {adp_roster_score(branch, team_id):>10.1f} | "
+              f"{projection_roster_score(branch, team_id):>15.1f}")
+
+    for name, branch in zip(player_names[1:], branches[1:]):
+        changes = branches[0].diff(branch)['rosters']
+        print(f"\n{player_names[0]} vs {name}:")
+        print(f"{'Slot':<8} | {player_names[0]:<25} | {name:<25}")
+        print("-" * 85)
+        for change in changes:
+            if change['team'] == team_id + 1:
+                print(f"{change['slot']:<8} | {change['this'] or '-':<25} | {change['other'] or '-':<25}")
+        other_teams = {change['team'] for change in changes} - {team_id + 1}
+        print(f"Other teams with different rosters: {len(other_teams)}")
+    print("=" * 85 + "\n")
+
+
 def run_draft_cli():
     """Run the fantasy baseball draft simulator as a command-line interface."""
-    draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID)  # Use the global MY_TEAM_ID
+    league = load_league_config()
+    teams_using_my_rank = list(TEAMS_USING_MY_RANK)
+    teams_using_third_rank = list(TEAMS_USING_THIRD_RANK)
+    draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID, league=league,
+                                 team_strategies=build_team_strategies(teams_using_my_rank, teams_using_third_rank))
+    try:
+        draft.catalog  # Read the input files up front so problems surface before the menu
+    except DraftInputError as e:
+        print(f"ERROR: {e}")
+        print("Please ensure all required CSV files are in the current directory.")
+        sys.exit(1)
 
     while True:
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -943,6 +3183,13 @@ def run_draft_cli():
         print("8. Configure team rankings")
         print("9. View top available by ADP")
         print("A. View ADP value recommendations")
+        print("B. Run Monte Carlo simulation")
+        print("C. Undo picks")
+        print("D. Redo picks")
+        print("E. Recommend my next pick (lookahead search)")
+        print("F. Run strategy tournament")
+        print("G. Compare picks (what-if)")
+        print("H. Odds players last to my next picks")
         print("0. Exit")
 
         choice = input("\nEnter your choice: ").strip().upper()
@@ -950,8 +3197,9 @@ def run_draft_cli():
         if choice == '1':
             draft.draft_player()
         elif choice == '2':
-            team_id = int(input("Enter team ID (1-8): ")) - 1
-            if 0 <= team_id < 8:
+            num_teams = draft.league.num_teams
+            team_id = int(input(f"Enter team ID (1-{num_teams}): ")) - 1
+            if 0 <= team_id < num_teams:
                 draft.display_team_roster(team_id)
                 input("Press Enter to continue...")
             else:
@@ -963,13 +3211,14 @@ def run_draft_cli():
         elif choice == '4':
             confirm = input("Are you sure you want to reset the draft? (y/n): ")
             if confirm.lower() == 'y':
-                draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID)
+                draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID, catalog=draft.catalog,
+                                             team_strategies=draft.team_strategies)
         elif choice == '5':
-            filename = input("Enter filename (default: draft_state.json): ") or "draft_state.json"
+            filename = input("Enter filename (default: draft_journal.jsonl): ") or "draft_journal.jsonl"
             draft.save_draft_state(filename)
             input("Press Enter to continue...")
         elif choice == '6':
-            filename = input("Enter filename (default: draft_state.json): ") or "draft_state.json"
+            filename = input("Enter filename (default: draft_journal.jsonl): ") or "draft_journal.jsonl"
             draft.load_draft_state(filename)
             input("Press Enter to continue...")
         elif choice == '7':
@@ -980,9 +3229,12 @@ def run_draft_cli():
                 input("Press Enter to continue...")
         elif choice == '8':
             # Configure which teams use which ranking lists
-            configure_team_rankings()
+            teams_using_my_rank, teams_using_third_rank = configure_team_rankings(
+                league.num_teams, teams_using_my_rank, teams_using_third_rank)
             # Need to reload the draft to apply changes
-            draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID)
+            draft = FantasyBaseballDraft(my_team_id=MY_TEAM_ID, catalog=draft.catalog,
+                                         team_strategies=build_team_strategies(teams_using_my_rank,
+                                                                               teams_using_third_rank))
             input("Team ranking configuration updated. Press Enter to continue...")
         elif choice == '9':
             # View top available players by ADP
@@ -997,6 +3249,71 @@ def run_draft_cli():
             # View ADP value recommendations
             draft.display_adp_recommendations()
             input("Press Enter to continue...")
+        elif choice == 'B':
+            # Simulate many drafts with stochastic ADP-based opponents
+            try:
+                num_drafts = input("How many drafts to simulate? (default: 1000): ").strip()
+                num_drafts = int(num_drafts) if num_drafts else 1000
+                seed = input("Random seed (default: none): ").strip()
+                seed = int(seed) if seed else None
+            except ValueError:
+                num_drafts, seed = 1000, None
+            results = simulate_drafts(num_drafts, seed=seed, my_team_id=draft.my_team_id, catalog=draft.catalog,
+                                      team_strategies=draft.team_strategies)
+            display_simulation_results(results)
+            input("Press Enter to continue...")
+        elif choice in ('C', 'D'):
+            # Take back (or replay) picks without restarting the draft
+            undo = choice == 'C'
+            try:
+                count = input(f"How many picks to {'undo' if undo else 'redo'}? (default: 1): ").strip()
+                count = int(count) if count else 1
+            except ValueError:
+                count = 1
+            step = draft.undo_pick if undo else draft.redo_pick
+            done = 0
+            while done < count and step():
+                done += 1
+            print(f"{'Undid' if undo else 'Redid'} {done} pick(s).")
+            if done < count:
+                print(f"Nothing left to {'undo' if undo else 'redo'}.")
+            input("Press Enter to continue...")
+        elif choice == 'E':
+            try:
+                seconds = input("Search time in seconds? (default: 3): ").strip()
+                seconds = float(seconds) if seconds else 3.0
+            except ValueError:
+                seconds = 3.0
+            draft.display_pick_recommendations(seconds)
+            input("Press Enter to continue...")
+        elif choice == 'F':
+            # Compare the ranking lists and best available from every draft slot
+            scorer = input(f"Roster scorer ({'/'.join(ROSTER_SCORERS)}, default: adp): ").strip().lower() or 'adp'
+            if scorer not in ROSTER_SCORERS:
+                print(f"Unknown scorer '{scorer}'. Using adp.")
+                scorer = 'adp'
+            results = run_tournament(draft.catalog, scorer=scorer, value_metric=draft.value_metric,
+                                     configured=draft.team_strategies)
+            display_tournament_results(results)
+            input("Press Enter to continue...")
+        elif choice == 'G':
+            # Play the draft out from each candidate pick on its own fork
+            names = input("Players to compare (comma separated): ").split(',')
+            names = [name.strip() for name in names if name.strip()]
+            try:
+                display_what_if(draft, names, what_if_picks(draft, names))
+            except ValueError as e:
+                print(f"Error: {e}")
+            input("Press Enter to continue...")
+        elif choice == 'H':
+            # Chance each player is still there at my next two turns
+            try:
+                count = input("How many players to show? (default: 20): ").strip()
+                count = int(count) if count else 20
+            except ValueError:
+                count = 20
+            draft.display_availability_odds(count)
+            input("Press Enter to continue...")
         elif choice == '0':
             print("Exiting Fantasy Baseball Draft Simulator. Goodbye!")
             sys.exit()
@@ -1005,14 +3322,17 @@ def run_draft_cli():
             input("Press Enter to continue...")
 
 
-def configure_team_rankings():
-    """Configure which teams use which ranking lists."""
-    global TEAMS_USING_MY_RANK, TEAMS_USING_THIRD_RANK
+def configure_team_rankings(num_teams: int = 8, teams_using_my_rank: Sequence[int] = TEAMS_USING_MY_RANK,
+                            teams_using_third_rank: Sequence[int] = TEAMS_USING_THIRD_RANK
+                            ) -> Tuple[List[int], List[int]]:
+    """Ask which teams use which ranking lists; returns the new (my_rank, third_rank) team lists."""
+    teams_using_my_rank = list(teams_using_my_rank)
+    teams_using_third_rank = list(teams_using_third_rank)
     
     print("\n==== TEAM RANKING CONFIGURATION ====")
     print("Current settings:")
-    print(f"Teams using your ranking list (my_rank.csv): {', '.join(f'Team {t+1}' for t in TEAMS_USING_MY_RANK)}")
-    print(f"Teams using third-party ranking list (third_rank.csv): {', '.join(f'Team {t+1}' for t in TEAMS_USING_THIRD_RANK)}")
+    print(f"Teams using your ranking list (my_rank.csv): {', '.join(f'Team {t+1}' for t in teams_using_my_rank)}")
+    print(f"Teams using third-party ranking list (third_rank.csv): {', '.join(f'Team {t+1}' for t in teams_using_third_rank)}")
     print("All other teams use best available player strategy")
     print("\nNote: Teams can only use one ranking list. If you assign a team to both lists,")
     print("it will only use the first list (your ranking list).")
@@ -1022,13 +3342,13 @@ def configure_team_rankings():
     if my_rank_input.strip():
         try:
             # Convert 1-based team numbers to 0-based team IDs
-            TEAMS_USING_MY_RANK = []
+            teams_using_my_rank = []
             for t in my_rank_input.split(','):
                 t = t.strip()
                 if t:
                     team_id = int(t) - 1
-                    if 0 <= team_id < 8:
-                        TEAMS_USING_MY_RANK.append(team_id)
+                    if 0 <= team_id < num_teams:
+                        teams_using_my_rank.append(team_id)
         except ValueError:
             print("Invalid input. Using previous configuration.")
     
@@ -1037,24 +3357,232 @@ def configure_team_rankings():
     if third_rank_input.strip():
         try:
             # Convert 1-based team numbers to 0-based team IDs
-            TEAMS_USING_THIRD_RANK = []
+            teams_using_third_rank = []
             for t in third_rank_input.split(','):
                 t = t.strip()
                 if t:
                     team_id = int(t) - 1
-                    if 0 <= team_id < 8 and team_id not in TEAMS_USING_MY_RANK:
-                        TEAMS_USING_THIRD_RANK.append(team_id)
+                    if 0 <= team_id < num_teams and team_id not in teams_using_my_rank:
+                        teams_using_third_rank.append(team_id)
         except ValueError:
             print("Invalid input. Using previous configuration.")
     else:
         # Remove any teams that are now in my_rank list
-        TEAMS_USING_THIRD_RANK = [t for t in TEAMS_USING_THIRD_RANK if t not in TEAMS_USING_MY_RANK]
+        teams_using_third_rank = [t for t in teams_using_third_rank if t not in teams_using_my_rank]
     
     print("\nUpdated configuration:")
-    print(f"Teams using your ranking list: {', '.join(f'Team {t+1}' for t in TEAMS_USING_MY_RANK)}")
-    print(f"Teams using third-party ranking list: {', '.join(f'Team {t+1}' for t in TEAMS_USING_THIRD_RANK)}")
+    print(f"Teams using your ranking list: {', '.join(f'Team {t+1}' for t in teams_using_my_rank)}")
+    print(f"Teams using third-party ranking list: {', '.join(f'Team {t+1}' for t in teams_using_third_rank)}")
     print("All other teams use best available player strategy")
+    return teams_using_my_rank, teams_using_third_rank
+
+
+# Columns of the headless results, one row per pick
+BATCH_FIELDS = ('run', 'seed', 'overall', 'round', 'pick', 'team', 'strategy', 'player', 'positions', 'slot', 'adp')
+
+
+def run_batch(runs: int = 1, seed: Optional[int] = None, league: Optional[LeagueConfig] = None,
+              my_team_id: int = MY_TEAM_ID, team_strategies: Optional[Dict[int, str]] = None,
+              value_metric: str = 'adp', adp_opponents: bool = False, use_cache: bool = True) -> List[Dict[str, Any]]:
+    """Run complete drafts without prompts or output and return one row per pick (see BATCH_FIELDS).
+
+    Every team follows team_strategies unless adp_opponents is set, in which
+    case the other teams pick stochastically by ADP as in simulate_drafts.
+    Each run gets a seed derived from `seed`.
+    """
+    loader = FantasyBaseballDraft(my_team_id=my_team_id, verbose=False, league=league)
+    loader._check_required_files()
+    catalog = loader.load_catalog(use_cache=use_cache)
+    seed_rng = random.Random(seed)
+
+    rows = []
+    plan = None
+    for run in range(runs):
+        run_seed = seed_rng.getrandbits(32)
+        draft = FantasyBaseballDraft(my_team_id=my_team_id, catalog=catalog, verbose=False,
+                                     value_metric=value_metric, team_strategies=team_strategies)
+        if adp_opponents:
+            if plan is None:
+                plan = adp_sampling_plan(draft.state['all_players'])
+            simulate_single_draft(draft, random.Random(run_seed), plan)
+        else:
+            while not draft.state['completed']:
+                draft.draft_player()
+        logger.info("Run %d (seed %d) drafted %d picks", run + 1, run_seed, len(draft.state['history']))
+
+        for overall, (round_idx, pick, team_id, player_id, slot) in enumerate(draft.state['history']):
+            player = draft.players[player_id] if player_id is not None else None
+            if adp_opponents and team_id != my_team_id:
+                strategy = 'adp_sample'
+            else:
+                strategy = draft.team_strategy(team_id)
+            rows.append({
+                'run': run + 1,
+                'seed': run_seed,
+                'overall': overall + 1,
+                'round': round_idx + 1,
+                'pick': pick + 1,
+                'team': team_id + 1,
+                'strategy': strategy,
+                'player': player.name if player else None,
+                'positions': ','.join(player.positions) if player else None,
+                'slot': slot,
+                'adp': player.adp['adp'] if player and player.adp else None
+            })
+    return rows
+
+
+def write_batch_results(rows: List[Dict[str, Any]], output: str = '-', output_format: str = 'json',
+                        config: Optional[Dict[str, Any]] = None):
+    """Write batch rows as CSV or as a JSON document, in one write to a file or stdout ('-')."""
+    buffer = io.StringIO()
+    if output_format == 'csv':
+        writer = csv.DictWriter(buffer, fieldnames=BATCH_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        json.dump({'config': config or {}, 'picks': rows}, buffer)
+        buffer.write('\n')
+    write_output(buffer.getvalue(), output)
+
+
+def write_output(text: str, output: str = '-'):
+    """Write text to a file, or to stdout for '-'."""
+    if output == '-':
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    else:
+        with open(output, 'w', newline='', encoding='utf-8') as f:
+            f.write(text)
+
+
+NAME_REPORT_FIELDS = ('source', 'name', 'match', 'players', 'suggestion', 'similarity')
+
+
+def write_name_report(catalog: Dict[str, Any], output: str = '-'):
+    """Write the catalog's name reconciliation as CSV.
+
+    One row per input name that does not spell its player exactly: how it
+    matched (a NAME_MATCH_TIERS tier, or 'unmatched') and the players it
+    matched, or for unmatched names the closest player name.
+    """
+    players = catalog['players']
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    writer.writerow(NAME_REPORT_FIELDS)
+    for source, matches in catalog['name_matches'].items():
+        for name, (tier, player_ids, suggestion) in matches.items():
+            writer.writerow([source, name, tier or 'unmatched', '; '.join(players[i].name for i in player_ids),
+                             players[suggestion[0]].name if suggestion else '', suggestion[1] if suggestion else ''])
+    write_output(buffer.getvalue(), output)
+
+
+def parse_team_list(value: str) -> List[int]:
+    """Parse a comma-separated list of 1-based team numbers into team IDs (argparse type)."""
+    try:
+        return [int(t) - 1 for t in value.split(',') if t.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected comma-separated team numbers, got {value!r}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse the command line and run the interactive draft, a headless batch or a profiling run."""
+    parser = argparse.ArgumentParser(description="Fantasy baseball draft simulator.")
+    parser.add_argument('--profile', metavar='FILE',
+                        help="auto-complete a draft with hot-path counters and timers, and write them to FILE")
+    parser.add_argument('--profile-format', choices=('json', 'chrome'), default='json',
+                        help="summary JSON or a Chrome trace (default: %(default)s)")
+    parser.add_argument('--name-report', metavar='FILE',
+                        help="write how the input files' player names were matched to players.csv as CSV "
+                             "(- for stdout)")
+
+    batch = parser.add_argument_group("headless batch runs")
+    batch.add_argument('--batch', action='store_true', help="run drafts without prompts and write the picks")
+    batch.add_argument('--league', default="league.json", help="league configuration file (default: %(default)s)")
+    batch.add_argument('--my-team', type=int, default=MY_TEAM_ID + 1, help="your team number (default: %(default)s)")
+    batch.add_argument('--my-rank-teams', type=parse_team_list, metavar='N,N',
+                       help="teams drafting from my_rank.csv (default: your team)")
+    batch.add_argument('--third-rank-teams', type=parse_team_list, metavar='N,N',
+                       help="teams drafting from third_rank.csv (default: %s)"
+                            % ','.join(str(t + 1) for t in TEAMS_USING_THIRD_RANK))
+    batch.add_argument('--value-metric', choices=sorted(VALUE_METRICS), default='adp',
+                       help="best-available ranking (default: %(default)s)")
+    batch.add_argument('--adp-opponents', action='store_true',
+                       help="other teams pick stochastically by ADP instead of by strategy")
+    batch.add_argument('--runs', type=int, default=1, help="number of drafts (default: %(default)s)")
+    batch.add_argument('--seed', type=int, help="seed for the per-run seeds")
+    batch.add_argument('--output', default='-', help="output file, or - for stdout (default: %(default)s)")
+    batch.add_argument('--format', choices=('json', 'csv'),
+                       help="output format (default: from the output file extension, else json)")
+    batch.add_argument('--no-cache', action='store_true', help="parse the input files instead of using the cache")
+    batch.add_argument('--log-level', choices=('debug', 'info', 'warning', 'error'),
+                       help="write diagnostics at this level and above to stderr (default: silent)")
+    args = parser.parse_args(argv)
+
+    if args.log_level:
+        logging.basicConfig(level=args.log_level.upper(), stream=sys.stderr,
+                            format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    elif not args.batch:
+        # The interactive draft shows warnings as plain messages
+        logging.basicConfig(level=logging.WARNING, stream=sys.stderr, format="%(message)s")
+
+    if args.batch:
+        my_team_id = args.my_team - 1
+        teams_using_my_rank = args.my_rank_teams if args.my_rank_teams is not None else [my_team_id]
+        teams_using_third_rank = (args.third_rank_teams if args.third_rank_teams is not None
+                                  else list(TEAMS_USING_THIRD_RANK))
+        output_format = args.format or ('csv' if args.output.lower().endswith('.csv') else 'json')
+        league = load_league_config(args.league)
+        for option, team_ids in (('--my-team', [my_team_id]), ('--my-rank-teams', teams_using_my_rank),
+                                 ('--third-rank-teams', teams_using_third_rank)):
+            out_of_range = [str(team_id + 1) for team_id in team_ids if not 0 <= team_id < league.num_teams]
+            if out_of_range:
+                parser.error(f"{option}: team numbers must be between 1 and {league.num_teams}, "
+                             f"got {','.join(out_of_range)}")
+        try:
+            rows = run_batch(args.runs, args.seed, league, my_team_id,
+                             build_team_strategies(teams_using_my_rank, teams_using_third_rank),
+                             args.value_metric, args.adp_opponents, not args.no_cache)
+        except DraftInputError as e:
+            logger.error("%s", e)
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        config = {
+            'league': league.to_dict(),
+            'my_team': args.my_team,
+            'my_rank_teams': [t + 1 for t in teams_using_my_rank],
+            'third_rank_teams': [t + 1 for t in teams_using_third_rank],
+            'value_metric': args.value_metric,
+            'adp_opponents': args.adp_opponents,
+            'runs': args.runs,
+            'seed': args.seed
+        }
+        write_batch_results(rows, args.output, output_format, config)
+        return 0
+
+    if args.name_report:
+        try:
+            catalog = FantasyBaseballDraft(verbose=False, league=load_league_config(args.league)).load_catalog(
+                use_cache=not args.no_cache)
+        except DraftInputError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 1
+        write_name_report(catalog, args.name_report)
+        return 0
+
+    if args.profile:
+        try:
+            profiler = profile_draft(args.profile, args.profile_format)
+        except DraftInputError as e:
+            print(f"ERROR: {e}")
+            return 1
+        profiler.display()
+        print(f"Profile written to {args.profile}")
+        return 0
+
+    run_draft_cli()
+    return 0
 
 
 if __name__ == "__main__":
-    run_draft_cli()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file